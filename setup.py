@@ -32,6 +32,12 @@ setup(
             "mypy>=1.0.0",
             "pre-commit>=2.20.0",
             "coverage"
+        ],
+        "fast": [
+            "numba>=0.57.0"
+        ],
+        "monitor": [
+            "psutil>=5.9.0"
         ]
     },
     python_requires=">=3.8",
@@ -8,15 +8,35 @@ __version__ = "0.1.0"
 __author__ = "FLL-Sim Development Team"
 __email__ = "dev@fll-sim.org"
 
-from .core.simulator import Simulator
-from .robot.robot import Robot
-from .environment.game_map import GameMap
-from .environment.mission import Mission
-from .sensors.sensor_base import Sensor
-from .sensors.color_sensor import ColorSensor
-from .sensors.ultrasonic_sensor import UltrasonicSensor
-from .sensors.gyro_sensor import GyroSensor
-from .sensors.touch_sensor import TouchSensor
+import importlib
+
+# Public classes are imported on first access, so importing a light
+# submodule (the GUI, config or cloud helpers) does not load pygame and
+# pymunk through the simulator.
+_EXPORTS = {
+    "Simulator": ".core.simulator",
+    "Robot": ".robot.robot",
+    "GameMap": ".environment.game_map",
+    "Mission": ".environment.mission",
+    "Sensor": ".sensors.sensor_base",
+    "ColorSensor": ".sensors.color_sensor",
+    "UltrasonicSensor": ".sensors.ultrasonic_sensor",
+    "GyroSensor": ".sensors.gyro_sensor",
+    "TouchSensor": ".sensors.touch_sensor",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "Simulator",
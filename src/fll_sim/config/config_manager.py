@@ -5,11 +5,12 @@ This module provides configuration loading, validation, and management
 for different simulation scenarios, robot setups, and FLL seasons.
 """
 
+import copy
 import json
 import os
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -44,8 +45,25 @@ class ConfigManager:
         self.logger = FLLLogger('ConfigManager')
         self.profiles: List[SimulationProfile] = []
         self.active_profile: Optional[SimulationProfile] = None
+        # Parsed YAML by path, with the mtime it was parsed at
+        self._yaml_cache: Dict[Path, Tuple[int, Any]] = {}
         self.logger.info("ConfigManager initialized.")
 
+    def _read_yaml(self, path) -> Any:
+        """Parse a YAML file, reusing the last result while it is unchanged.
+
+        The returned data is shared between callers and must not be mutated.
+        """
+        path = Path(path)
+        mtime = path.stat().st_mtime_ns
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        self._yaml_cache[path] = (mtime, data)
+        return data
+
     def _create_default_configs(self):
         """Create default configuration files if they don't exist."""
         
@@ -287,8 +305,7 @@ class ConfigManager:
             # Try defaults
             config_file = self.config_dir / "robots" / "defaults.yaml"
         
-        with open(config_file, 'r') as f:
-            configs = yaml.safe_load(f)
+        configs = self._read_yaml(config_file)
         
         if name not in configs:
             raise ValueError(f"Robot configuration '{name}' not found")
@@ -312,8 +329,7 @@ class ConfigManager:
         """Load simulation configuration by name."""
         config_file = self.config_dir / "simulations" / "defaults.yaml"
         
-        with open(config_file, 'r') as f:
-            configs = yaml.safe_load(f)
+        configs = self._read_yaml(config_file)
         
         if name not in configs:
             raise ValueError(f"Simulation configuration '{name}' not found")
@@ -335,8 +351,7 @@ class ConfigManager:
         """Load Pybricks configuration by name."""
         config_file = self.config_dir / "robots" / "pybricks_defaults.yaml"
         
-        with open(config_file, 'r') as f:
-            configs = yaml.safe_load(f)
+        configs = self._read_yaml(config_file)
         
         if name not in configs:
             raise ValueError(f"Pybricks configuration '{name}' not found")
@@ -356,8 +371,7 @@ class ConfigManager:
         """Load complete simulation profile by name."""
         config_file = self.config_dir / "profiles" / "defaults.yaml"
         
-        with open(config_file, 'r') as f:
-            profiles = yaml.safe_load(f)
+        profiles = self._read_yaml(config_file)
         
         if name not in profiles:
             raise ValueError(f"Profile '{name}' not found")
@@ -405,32 +419,27 @@ class ConfigManager:
         # Load robot configs
         robot_file = self.config_dir / "robots" / "defaults.yaml"
         if robot_file.exists():
-            with open(robot_file, 'r') as f:
-                configs["robots"] = list(yaml.safe_load(f).keys())
+            configs["robots"] = list(self._read_yaml(robot_file).keys())
         
         # Load simulation configs
         sim_file = self.config_dir / "simulations" / "defaults.yaml"
         if sim_file.exists():
-            with open(sim_file, 'r') as f:
-                configs["simulations"] = list(yaml.safe_load(f).keys())
+            configs["simulations"] = list(self._read_yaml(sim_file).keys())
         
         # Load Pybricks configs
         pybricks_file = self.config_dir / "robots" / "pybricks_defaults.yaml"
         if pybricks_file.exists():
-            with open(pybricks_file, 'r') as f:
-                configs["pybricks"] = list(yaml.safe_load(f).keys())
+            configs["pybricks"] = list(self._read_yaml(pybricks_file).keys())
         
         # Load profiles
         profile_file = self.config_dir / "profiles" / "defaults.yaml"
         if profile_file.exists():
-            with open(profile_file, 'r') as f:
-                configs["profiles"] = list(yaml.safe_load(f).keys())
+            configs["profiles"] = list(self._read_yaml(profile_file).keys())
         
         # Load FLL seasons
         season_file = self.config_dir / "missions" / "fll_seasons.yaml"
         if season_file.exists():
-            with open(season_file, 'r') as f:
-                configs["seasons"] = list(yaml.safe_load(f).keys())
+            configs["seasons"] = list(self._read_yaml(season_file).keys())
         
         return configs
     
@@ -438,13 +447,13 @@ class ConfigManager:
         """Get information about a specific FLL season."""
         season_file = self.config_dir / "missions" / "fll_seasons.yaml"
         
-        with open(season_file, 'r') as f:
-            seasons = yaml.safe_load(f)
+        seasons = self._read_yaml(season_file)
         
         if season not in seasons:
             raise ValueError(f"FLL season '{season}' not found")
         
-        return seasons[season]
+        # Copy so callers cannot alter the cached parse
+        return copy.deepcopy(seasons[season])
     
     def create_custom_robot(self, name: str, base_config: str, modifications: Dict[str, Any]):
         """Create a custom robot configuration based on an existing one."""
@@ -473,8 +482,7 @@ class ConfigManager:
     def load_profile(self, profile_path: str) -> None:
         """Load a simulation profile from a YAML file."""
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._read_yaml(profile_path)
             
             # Validate and parse profile data
             profile = SimulationProfile(
@@ -484,8 +492,9 @@ class ConfigManager:
                 simulation_config=self.load_simulation_config(data["simulation_config"]),
                 pybricks_config=self.load_pybricks_config(data["pybricks_config"]),
                 fll_season=data["fll_season"],
-                map_config=data.get("map_config"),
-                mission_config=data.get("mission_config")
+                # Copied so callers cannot mutate the cached YAML parse
+                map_config=copy.deepcopy(data.get("map_config")),
+                mission_config=copy.deepcopy(data.get("mission_config"))
             )
             
             self.profiles.append(profile)
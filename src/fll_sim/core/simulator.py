@@ -17,6 +17,8 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import queue
+import sys
 import threading
 import time
 from dataclasses import dataclass
@@ -50,6 +52,8 @@ class SimulationConfig:
     window_width: int = 1200
     window_height: int = 800
     fps: int = 60
+    # Loop rate while paused; events are still handled, nothing is stepped
+    paused_fps: int = 10
 
     # Game settings
     real_time_factor: float = 1.0
@@ -99,6 +103,22 @@ class Simulator:
             self.simulation_time = 0.0
             self.frame_count = 0
 
+            # Machine-readable status lines on stdout for a parent process;
+            # FLL_SIM_STATUS_INTERVAL is in seconds, unset or 0 disables
+            self.status_interval = float(
+                os.environ.get("FLL_SIM_STATUS_INTERVAL") or 0.0
+            )
+            self._next_status = 0.0
+            self._last_status: Optional[dict] = None
+
+            # Line commands from a parent process on stdin when
+            # FLL_SIM_COMMANDS=stdin; queued and run on the loop thread
+            self._commands: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+            if os.environ.get("FLL_SIM_COMMANDS") == "stdin":
+                threading.Thread(
+                    target=self._read_commands, daemon=True
+                ).start()
+
             # Callbacks
             self.on_mission_complete: List[Callable[..., None]] = []
             self.on_collision: List[Callable[..., None]] = []
@@ -183,6 +203,17 @@ class Simulator:
             pygame.K_q: self.stop,
             pygame.K_d: self.toggle_debug,
         }
+        # Same actions for commands sent by a supervising process
+        self.command_handlers = {
+            "pause": self.toggle_pause,
+            "reset": self.reset_simulation,
+            "stop": self.stop,
+        }
+
+    def _read_commands(self) -> None:
+        """Queue stdin command lines until the parent closes the pipe."""
+        for line in sys.stdin:
+            self._commands.put(line.strip())
 
     def start(self) -> None:
         """Start the simulation loop."""
@@ -256,7 +287,9 @@ class Simulator:
             real_dt = current_time - last_time
             last_time = current_time
 
-            # Handle events
+            # Handle events; commands are separate since embedders may
+            # replace _handle_events
+            self._run_commands()
             self._handle_events()
 
             # Update simulation if not paused
@@ -268,11 +301,49 @@ class Simulator:
             # Render
             self._render()
 
-            # Control frame rate
-            self.clock.tick(self.config.fps)
+            # Control frame rate; idle along at a low rate while paused
+            self.clock.tick(
+                self.config.paused_fps if self.paused else self.config.fps
+            )
 
-    # Cleanup
-    pygame.quit()
+            if self.status_interval and current_time >= self._next_status:
+                self._next_status = current_time + self.status_interval
+                self._emit_status()
+
+    def _emit_status(self) -> None:
+        """Print one JSON status line for a supervising process.
+
+        Nothing is printed when the report matches the previous one (e.g.
+        while paused), so an idle simulation does not wake the parent.
+        """
+        status = {
+            "time": round(self.simulation_time, 2),
+            "fps": round(self.clock.get_fps()),
+            "frame": self.frame_count,
+        }
+        if self.competition_mode:
+            status["time_left"] = round(self.competition_time_left, 1)
+            status["progress"] = round(
+                1.0
+                - self.competition_time_left
+                / max(self.competition_time_limit, 1),
+                3,
+            )
+        if status == self._last_status:
+            return
+        self._last_status = status
+        print(json.dumps(status), flush=True)
+
+    def _run_commands(self) -> None:
+        """Run commands queued by _read_commands."""
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            handler = self.command_handlers.get(command)
+            if handler is not None:
+                handler()
 
     def _handle_events(self) -> None:
         """Handle pygame events."""
@@ -474,9 +545,40 @@ def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: Optional[List[str]] = None) -> None:
-    """Module entrypoint: construct and run the simulator based on CLI args."""
-    args = _parse_args(argv)
+def run(
+    *,
+    profile: str = "beginner",
+    robot: str = "standard_fll",
+    season: str = "2024",
+    debug: bool = False,
+    performance: bool = False,
+    log: bool = False,
+    headless: bool = False,
+    exit_after: float = 0.0,
+    background_image: str = "",
+    background_size: str = "",
+    mat_url: str = "",
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Construct and run the simulator in the calling process.
+
+    Keyword arguments mirror the CLI options of :func:`main`. When
+    ``stop_event`` is given, setting it stops the simulation loop; it is
+    also set once the simulator has stopped. Blocks until the loop exits.
+    """
+    args = argparse.Namespace(
+        profile=profile,
+        robot=robot,
+        season=str(season),
+        debug=debug,
+        performance=performance,
+        log=log,
+        headless=headless,
+        exit_after=exit_after,
+        background_image=background_image,
+        background_size=background_size,
+        mat_url=mat_url,
+    )
 
     # Handle mat URL download before checking for background image
     if args.mat_url and not args.background_image:
@@ -528,8 +630,7 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     # Create core objects (extend later to use profile/robot/season configs)
     game_map = GameMap()
-    robot = Robot()
-    sim = Simulator(robot=robot, game_map=game_map, config=sim_config)
+    sim = Simulator(robot=Robot(), game_map=game_map, config=sim_config)
 
     # Optional background mat image
     try:
@@ -559,24 +660,37 @@ def main(argv: Optional[List[str]] = None) -> None:
     except (FileNotFoundError, OSError) as e:
         print(f"[sim] Warning: failed to load background image: {e}")
 
-    # Support timed exit for CI/headless demos
-    stopper = None
-    if args.exit_after and args.exit_after > 0:
+    # Stop on request from the embedding process, or after a timed exit
+    # for CI/headless demos
+    timeout = args.exit_after if args.exit_after > 0 else None
+    if stop_event is not None or timeout is not None:
+        if stop_event is None:
+            stop_event = threading.Event()
+        done = stop_event
+
         def _stop_later() -> None:
-            time.sleep(args.exit_after)
+            done.wait(timeout)
             sim.stop()
 
-        stopper = threading.Thread(target=_stop_later, daemon=True)
-        stopper.start()
+        threading.Thread(target=_stop_later, daemon=True).start()
 
     try:
         sim.start()
     except KeyboardInterrupt:
         sim.stop()
     finally:
+        # Release the window and SDL state; embedders may start another run
+        pygame.quit()
+        if stop_event is not None:
+            stop_event.set()
         print("[sim] Simulator stopped")
 
 
+def main(argv: Optional[List[str]] = None) -> None:
+    """Module entrypoint: construct and run the simulator based on CLI args."""
+    run(**vars(_parse_args(argv)))
+
+
 if __name__ == "__main__":
     main()
 
@@ -737,7 +737,7 @@ class GameMap:
         """Reset the game map to initial state."""
         # Reset mission states
         if hasattr(self, 'mission_manager') and self.mission_manager:
-            self.mission_manager.reset_session()
+            self.mission_manager.reset_all_missions()
 
         # Reset any movable objects to initial positions
         self.mission_objects.clear()
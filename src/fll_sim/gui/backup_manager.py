@@ -3,23 +3,83 @@ Backup Manager GUI integration for FLL-Sim
 
 Provides user controls for scheduled cloud backups, status display, and error reporting.
 """
-from PyQt6.QtWidgets import (QLabel, QListWidget, QMessageBox, QPushButton,
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import (QAbstractListModel, QModelIndex, QStandardPaths,
+                          Qt)
+from PyQt6.QtWidgets import (QLabel, QListView, QMessageBox, QPushButton,
                              QVBoxLayout, QWidget)
 
-from fll_sim.cloud.cloud_auto_backup import CloudAutoBackup
-from fll_sim.utils.backup_utils import BackupUtils
-from fll_sim.utils.cloud_utils import CloudUtils
+
+class BackupListModel(QAbstractListModel):
+    """
+    List model holding raw backup records and formatting them on demand.
+
+    Sizes need a walk of the backup, so they are only computed for the
+    tooltip of a row that is hovered, and remembered until the next reset.
+    """
+    def __init__(self, parent=None, size_of: Optional[Callable] = None):
+        super().__init__(parent)
+        self._rows: List = []
+        self._size_of = size_of
+        self._sizes: Dict[str, int] = {}
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._rows = list(entries)
+        self._sizes.clear()
+        self.endResetModel()
+
+    def entry(self, row: int):
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            e = self._rows[index.row()]
+            stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(e.mtime))
+            return f"{e.name}  ({stamp})"
+        if role == Qt.ItemDataRole.ToolTipRole and self._size_of is not None:
+            e = self._rows[index.row()]
+            size = self._sizes.get(e.name)
+            if size is None:
+                try:
+                    size = self._sizes[e.name] = self._size_of(e.name)
+                except OSError:
+                    return None
+            return f"{size >> 20} MiB"
+        return None
 
 
 class BackupManagerWidget(QWidget):
     """
     Widget for managing cloud auto backup in the GUI.
     """
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, cloud_utils=None, backup_utils=None):
         super().__init__(parent)
-        self.cloud_utils = CloudUtils()
+        # Cloud backends are imported here so importing the GUI package
+        # does not pay for them until a backup panel is actually built.
+        from fll_sim.cloud.cloud_auto_backup import CloudAutoBackup
+        from fll_sim.utils.backup_utils import BackupUtils
+        from fll_sim.utils.cloud_utils import CloudUtils
+
+        self.cloud_utils = cloud_utils or CloudUtils.instance()
         self.auto_backup = CloudAutoBackup(self.cloud_utils, interval=3600)
-        self.backup_utils = BackupUtils()
+        self.backup_utils = backup_utils or BackupUtils.instance()
+        self._last_status: Optional[str] = None
+        self._restore_root = Path(
+            QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.AppDataLocation
+            )
+        ) / "restores"
+        self._restore_path = os.fspath(self._restore_root)
         self._setup_ui()
         self._update_status()
 
@@ -38,7 +98,12 @@ class BackupManagerWidget(QWidget):
         layout.addWidget(self.start_btn)
         layout.addWidget(self.stop_btn)
         layout.addWidget(QLabel("Backup History"))
-        self.backup_list = QListWidget()
+        self._backup_model = BackupListModel(
+            self, size_of=self.backup_utils.backup_size
+        )
+        self.backup_list = QListView()
+        self.backup_list.setUniformItemSizes(True)
+        self.backup_list.setModel(self._backup_model)
         layout.addWidget(self.backup_list)
         layout.addWidget(self.refresh_button)
         layout.addWidget(self.restore_button)
@@ -48,32 +113,39 @@ class BackupManagerWidget(QWidget):
             self.auto_backup.start()
             self._update_status()
         except Exception as e:
-            self.status_label.setText(f"Error: {e}")
+            self._set_status_text(f"Error: {e}")
 
     def _stop_backup(self):
         try:
             self.auto_backup.stop()
             self._update_status()
         except Exception as e:
-            self.status_label.setText(f"Error: {e}")
+            self._set_status_text(f"Error: {e}")
 
     def _update_status(self):
         status = self.auto_backup.get_status()
-        self.status_label.setText(f"Backup Status: {status}")
+        self._set_status_text(f"Backup Status: {status}")
+
+    def _set_status_text(self, text: str):
+        """Update the status label only when the text actually changes."""
+        if text == self._last_status:
+            return
+        self._last_status = text
+        self.status_label.setText(text)
 
     def load_backups(self):
-        self.backup_list.clear()
-        backups = self.backup_utils.list_backups()
-        for backup in backups:
-            self.backup_list.addItem(backup)
+        self._backup_model.set_entries(
+            self.backup_utils.list_backup_entries()
+        )
 
     def restore_selected(self):
-        selected = self.backup_list.currentItem()
-        if selected:
-            backup_name = selected.text()
+        selected = self.backup_list.currentIndex()
+        if selected.isValid():
+            backup_name = self._backup_model.entry(selected.row()).name
             try:
-                # Pass restore_path explicitly
-                self.backup_utils.restore_backup(backup_name, restore_path="/home/kevin/Projects/FLL-SIM")
+                self.backup_utils.restore_backup(
+                    backup_name, restore_path=self._restore_path
+                )
                 QMessageBox.information(
                     self,
                     "Restore",
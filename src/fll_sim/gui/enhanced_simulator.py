@@ -4,30 +4,49 @@ This module provides a simulator view with:
 - Properly scaled background mat
 - Correctly sized barriers (obstacles) rendered as rectangles
 - Color zones rendered as rectangles
-- Robot drawn with a correct arrow-like polygon (front tip) and
-    correct point order
+- Robot drawn as a rectangle body with a child nose marking the front
 - A main window with menus, toolbar, tabs, and basic controls
 """
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from PyQt6.QtCore import QPointF, QRectF, Qt, pyqtSignal
+import numpy as np
+from PyQt6.QtCore import (QObject, QPointF, QRectF, QRunnable, Qt, QThreadPool,
+                          QTimer, pyqtSignal)
 from PyQt6.QtGui import (QAction, QActionGroup, QBrush, QColor, QFont,
-                         QPainter, QPen, QPolygonF)
+                         QFontDatabase, QIcon, QPainter, QPainterPath, QPen,
+                         QPixmap, QPolygonF, QStaticText, QSurfaceFormat,
+                         QTransform)
 from PyQt6.QtWidgets import (QCheckBox, QFileDialog, QFormLayout,
-                             QGraphicsItem, QGraphicsPolygonItem,
-                             QGraphicsRectItem, QGraphicsScene,
-                             QGraphicsTextItem, QGraphicsView, QHBoxLayout,
-                             QLabel, QListWidget, QListWidgetItem, QMainWindow,
-                             QMenuBar, QMessageBox, QPushButton, QSpinBox,
-                             QSplitter, QStatusBar, QTabWidget, QTextEdit,
-                             QToolBar, QVBoxLayout, QWidget)
+                             QGraphicsItem, QGraphicsItemGroup,
+                             QGraphicsPixmapItem, QGraphicsPolygonItem,
+                             QGraphicsRectItem, QGraphicsScene, QGraphicsView,
+                             QHBoxLayout, QLabel, QListWidget, QListWidgetItem,
+                             QMainWindow, QMenuBar, QMessageBox,
+                             QPlainTextEdit, QPushButton, QSpinBox, QSplitter,
+                             QStatusBar, QTabWidget, QToolBar, QVBoxLayout,
+                             QWidget)
 
 from ..environment.game_map import GameMap
+from ..visualization._fast import zone_hit
 from ..visualization.background import BackgroundConfig, BackgroundRenderer
 
+# Robot pose updates are applied at most once per display frame (~60 Hz)
+POSE_REFRESH_MS = 16
+
+# Interactive resizes are coalesced into one refit after this quiet period
+RESIZE_REFIT_MS = 50
+
+# Lines kept in the Output tab before the oldest are discarded
+OUTPUT_MAX_LINES = 1000
+
+# Map elements built per event-loop turn once the view is first shown;
+# each expensive build phase also gets an event-loop turn of its own
+MAP_BUILD_CHUNK = 50
+
 # Colors
 OBJECT_COLORS = {
     "robot": QColor(50, 150, 50),
@@ -45,9 +64,106 @@ SENSOR_COLOR_MAP = {
     "white": QColor(245, 245, 245, 150),
 }
 
+# Shared drawing resources; items keep references, so never mutate these
+_BLACK_PEN_2 = QPen(QColor(0, 0, 0), 2)
+_WHITE_PEN_2 = QPen(QColor(255, 255, 255), 2)
+_NO_PEN = QPen(Qt.PenStyle.NoPen)
+_BLACK_TEXT = QColor(0, 0, 0)
+_GRID_PEN = QPen(QColor(200, 200, 200, 100), 1, Qt.PenStyle.DashLine)
+_ROBOT_BRUSH = QBrush(OBJECT_COLORS["robot"])
+_OBSTACLE_BRUSH = QBrush(OBJECT_COLORS["obstacle"])
+_WAYPOINT_BRUSH = QBrush(OBJECT_COLORS["waypoint"])
+_WAYPOINT_PEN = QPen(OBJECT_COLORS["waypoint"], 3)
+# Keyed by sensor name, plus RGB(A) tuples added on first use
+_ZONE_BRUSHES: Dict[Union[str, Tuple[int, ...]], QBrush] = {
+    k: QBrush(c) for k, c in SENSOR_COLOR_MAP.items()
+}
+_DEFAULT_ZONE_BRUSH = QBrush(QColor(100, 100, 255, 128))
+_ROBOT_LABEL_COLOR = QColor(0, 100, 0)
+_LABEL_FONT_BOLD = QFont()
+_LABEL_FONT_BOLD.setBold(True)
+
+# Legend entries shown by LegendWidget: (label, OBJECT_COLORS key)
+LEGEND_ITEMS = (
+    ("Robot", "robot"),
+    ("Obstacle", "obstacle"),
+    ("Waypoint", "waypoint"),
+)
+
+# Starting text for the code editor and File > New
+_NEW_PROGRAM_TEMPLATE = "# New Robot Program\nprint('Hello, FLL!')\n"
+
+_EDITOR_FONT: Optional[QFont] = None
+
+_LEGEND_ICONS: Optional[List[Tuple[str, QColor, QIcon]]] = None
+
+
+def _make_swatch(color: QColor) -> QPixmap:
+    pix = QPixmap(16, 16)
+    pix.fill(color)
+    return pix
+
+
+def _zone_brush(zone) -> QBrush:
+    """Return a shared brush for a colour zone.
+
+    Prefers the sensor_value mapping, then an explicit RGB(A) color tuple,
+    then the default zone brush. Tuple brushes are cached by value.
+    """
+    brush = _ZONE_BRUSHES.get(getattr(zone, "sensor_value", "") or "")
+    if brush is not None:
+        return brush
+    col = getattr(zone, "color", None)
+    if not isinstance(col, (list, tuple)) or not 3 <= len(col) <= 4:
+        return _DEFAULT_ZONE_BRUSH
+    key = tuple(int(c) for c in col)
+    brush = _ZONE_BRUSHES.get(key)
+    if brush is None:
+        brush = _ZONE_BRUSHES[key] = QBrush(QColor(*key))
+    return brush
+
+
+def _shape_of(obj) -> Tuple[float, float, float, float, float]:
+    """(x, y, width, height, angle) of a centred map rectangle."""
+    angle = float(getattr(obj, "angle", 0.0) or 0.0)
+    return (obj.x, obj.y, float(obj.width), float(obj.height), angle)
+
+
+def _zone_style(zone) -> tuple:
+    """The zone attributes that decide its brush, for change detection."""
+    col = getattr(zone, "color", None)
+    if isinstance(col, list):
+        col = tuple(col)
+    return (getattr(zone, "sensor_value", "") or "", col)
+
+
+def _get_editor_font() -> QFont:
+    """Resolve the fixed-width editor font once per process."""
+    global _EDITOR_FONT
+    if _EDITOR_FONT is None:
+        _EDITOR_FONT = QFontDatabase.systemFont(
+            QFontDatabase.SystemFont.FixedFont
+        )
+    return _EDITOR_FONT
+
+
+def _get_legend_icons() -> List[Tuple[str, QColor, QIcon]]:
+    """Build the legend swatch icons once and share them across widgets."""
+    global _LEGEND_ICONS
+    if _LEGEND_ICONS is None:
+        icons = []
+        for name, key in LEGEND_ITEMS:
+            color = OBJECT_COLORS[key]
+            icons.append((name, color, QIcon(_make_swatch(color))))
+        _LEGEND_ICONS = icons
+    return _LEGEND_ICONS
+
 
-class RobotGraphicsItem(QGraphicsPolygonItem):
-    """Robot drawn as an arrow-like polygon pointing up (-Y)."""
+class RobotGraphicsItem(QGraphicsRectItem):
+    """Robot drawn as a rectangle body with a nose pointing up (-Y)."""
+
+    # Nose polygons shared by every robot of the same (width, height)
+    _nose_cache: Dict[Tuple[float, float], QPolygonF] = {}
 
     def __init__(
         self,
@@ -59,54 +175,280 @@ class RobotGraphicsItem(QGraphicsPolygonItem):
     ):
         half_w = width / 2
         half_h = height / 2
-        # Create arrow-like robot shape with front tip pointing up (-Y)
-        # Points ordered clockwise starting from front tip
-        poly = QPolygonF(
-            [
-                QPointF(0, -half_h - 15),  # front tip (pointing up)
-                QPointF(half_w * 0.6, -half_h),  # right shoulder
-                QPointF(half_w, -half_h * 0.3),  # right side
-                QPointF(half_w, half_h),  # right back
-                QPointF(-half_w, half_h),  # left back
-                QPointF(-half_w, -half_h * 0.3),  # left side
-                QPointF(-half_w * 0.6, -half_h),  # left shoulder
-            ]
-        )
-        super().__init__(poly)
+        super().__init__(QRectF(-half_w, -half_h, width, height))
         self.setPos(x, y)
         self.setRotation(angle)
-        self.setBrush(QBrush(OBJECT_COLORS["robot"]))
-        self.setPen(QPen(QColor(0, 0, 0), 2))
+        self.setBrush(_ROBOT_BRUSH)
+        self.setPen(_BLACK_PEN_2)
         self.setZValue(100)
+        # Shape never changes, only pose: cache in item coordinates
+        self.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)
+
+        # Direction arrow on the front edge, moved with the body as a child
+        key = (width, height)
+        poly = self._nose_cache.get(key)
+        if poly is None:
+            poly = self._nose_cache[key] = QPolygonF(
+                [
+                    QPointF(0, -half_h - 15),  # front tip (pointing up)
+                    QPointF(half_w * 0.6, -half_h),  # right shoulder
+                    QPointF(-half_w * 0.6, -half_h),  # left shoulder
+                ]
+            )
+        nose = QGraphicsPolygonItem(QPolygonF(poly), self)
+        nose.setBrush(_ROBOT_BRUSH)
+        nose.setPen(_BLACK_PEN_2)
+        nose.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)
 
     def update_position(
         self, x: float, y: float, angle: Optional[float] = None
     ) -> None:
-        self.setPos(x, y)
-        if angle is not None:
+        # Each setter rebuilds the scene transform and schedules a repaint,
+        # so only call the ones whose value actually changed.
+        pos = self.pos()
+        if pos.x() != x or pos.y() != y:
+            self.setPos(x, y)
+        if angle is not None and angle != self.rotation():
             self.setRotation(angle)
 
 
+def _static_text(text: str, font: QFont) -> QStaticText:
+    st = QStaticText(text)
+    st.setTextFormat(Qt.TextFormat.PlainText)
+    st.prepare(QTransform(), font)
+    return st
+
+
+class FastLabel(QGraphicsItem):
+    """Plain-text label painted from a pre-laid-out QStaticText."""
+
+    def __init__(self, text: str, color: QColor, font: QFont) -> None:
+        super().__init__()
+        self._font = font
+        self._color = color
+        self._st = _static_text(text, font)
+        size = self._st.size()
+        self._rect = QRectF(0, 0, size.width(), size.height())
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        painter.drawStaticText(0, 0, self._st)
+
+
+class LabelLayer(QGraphicsItem):
+    """Single scene item that paints many short text labels in one pass."""
+
+    def __init__(self, rect: QRectF) -> None:
+        super().__init__()
+        self._rect = QRectF(rect)
+        self._font = QFont()
+        self._labels: List[Tuple[QPointF, QStaticText, QPen]] = []
+        self._pens: Dict[int, QPen] = {}
+
+    def add_label(self, x: float, y: float, text: str, color: QColor) -> None:
+        """Add a label whose text box starts at (x, y) in scene coords."""
+        pen = self._pens.get(color.rgba())
+        if pen is None:
+            pen = self._pens[color.rgba()] = QPen(color)
+        st = _static_text(text, self._font)
+        self._labels.append((QPointF(x, y), st, pen))
+        self.update()
+
+    def clear(self) -> None:
+        self._labels.clear()
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        painter.setFont(self._font)
+        current = None
+        for point, text, pen in self._labels:
+            if pen is not current:
+                painter.setPen(pen)
+                current = pen
+            painter.drawStaticText(point, text)
+
+
+class ShapeBatchItem(QGraphicsItem):
+    """Single scene item that paints many centred, optionally rotated
+    rectangles as one QPainterPath per brush.
+
+    Shapes sharing a brush are filled and stroked in a single drawPath
+    call; brush groups outside the exposed area are skipped.
+    """
+
+    def __init__(self, pen: QPen) -> None:
+        super().__init__()
+        self._pen = pen
+        self._groups: List[Tuple[QBrush, QPainterPath, QRectF]] = []
+        self._count = 0
+        self._rect = QRectF()
+        self.setFlag(
+            QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption
+        )
+
+    def set_shapes(
+        self,
+        shapes: List[Tuple[float, float, float, float, float]],
+        brushes: List[QBrush],
+    ) -> None:
+        """Replace the batch with (x, y, w, h, angle) rects and brushes."""
+        self.prepareGeometryChange()
+        # Brushes are shared module constants, so group them by identity
+        paths: Dict[int, Tuple[QBrush, QPainterPath]] = {}
+        for (x, y, w, h, angle), brush in zip(shapes, brushes):
+            entry = paths.get(id(brush))
+            if entry is None:
+                path = QPainterPath()
+                # Overlapping shapes must not punch holes in each other
+                path.setFillRule(Qt.FillRule.WindingFill)
+                entry = paths[id(brush)] = (brush, path)
+            path = entry[1]
+            rect = QRectF(x - w / 2, y - h / 2, w, h)
+            if angle:
+                xf = QTransform().translate(x, y).rotate(angle)
+                path.addPolygon(xf.map(QPolygonF(rect.translated(-x, -y))))
+                path.closeSubpath()
+            else:
+                path.addRect(rect)
+        margin = self._pen.widthF() / 2
+        self._groups = []
+        self._rect = QRectF()
+        for brush, path in paths.values():
+            bounds = path.boundingRect().adjusted(
+                -margin, -margin, margin, margin
+            )
+            self._groups.append((brush, path, bounds))
+            self._rect = self._rect.united(bounds)
+        self._count = len(shapes)
+        self.update()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        exposed = option.exposedRect
+        painter.setPen(self._pen)
+        for brush, path, bounds in self._groups:
+            if bounds.intersects(exposed):
+                painter.setBrush(brush)
+                painter.drawPath(path)
+
+
+class WaypointLayer(QGraphicsItem):
+    """Robot path drawn as dots joined by line segments.
+
+    Points live in a NumPy array grown by doubling, so adding a waypoint is
+    an amortised O(1) append. Only waypoints and segments touching the
+    exposed rect are painted.
+    """
+
+    DOT_RADIUS = 10.0
+
+    def __init__(self, capacity: int = 64) -> None:
+        super().__init__()
+        self._pts = np.empty((capacity, 2))
+        self._count = 0
+        self._rect = QRectF()
+        self.setFlag(
+            QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption
+        )
+
+    def add_point(self, x: float, y: float) -> None:
+        if self._count == len(self._pts):
+            grown = np.empty((2 * len(self._pts), 2))
+            grown[: self._count] = self._pts[: self._count]
+            self._pts = grown
+        r = self.DOT_RADIUS
+        self.prepareGeometryChange()
+        self._pts[self._count] = (x, y)
+        self._count += 1
+        self._rect = self._rect.united(QRectF(x - r, y - r, 2 * r, 2 * r))
+        self.update()
+
+    def clear(self) -> None:
+        self.prepareGeometryChange()
+        self._count = 0
+        self._rect = QRectF()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None) -> None:
+        if not self._count:
+            return
+        r = self.DOT_RADIUS
+        margin = r + _WAYPOINT_PEN.widthF()
+        exposed = option.exposedRect.adjusted(-margin, -margin, margin, margin)
+        left, right = exposed.left(), exposed.right()
+        top, bottom = exposed.top(), exposed.bottom()
+        pts = self._pts[: self._count]
+        xs = pts[:, 0]
+        ys = pts[:, 1]
+
+        if self._count > 1:
+            a, b = pts[:-1], pts[1:]
+            seg = np.flatnonzero(
+                (np.maximum(a[:, 0], b[:, 0]) >= left)
+                & (np.minimum(a[:, 0], b[:, 0]) <= right)
+                & (np.maximum(a[:, 1], b[:, 1]) >= top)
+                & (np.minimum(a[:, 1], b[:, 1]) <= bottom)
+            )
+            painter.setPen(_WAYPOINT_PEN)
+            for i in seg:
+                painter.drawLine(QPointF(*pts[i]), QPointF(*pts[i + 1]))
+
+        dots = np.flatnonzero(
+            (xs >= left) & (xs <= right) & (ys >= top) & (ys <= bottom)
+        )
+        painter.setPen(_NO_PEN)
+        painter.setBrush(_WAYPOINT_BRUSH)
+        for i in dots:
+            painter.drawEllipse(QPointF(xs[i], ys[i]), r, r)
+
+
+def _render_grid_pixmap(width: int, height: int, step: int) -> QPixmap:
+    """Rasterise the dashed coordinate grid once, one pixel per mm."""
+    pix = QPixmap(width, height)
+    pix.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pix)
+    painter.setPen(_GRID_PEN)
+    for x in range(step, width, step):
+        painter.drawLine(x, 0, x, height)
+    for y in range(step, height, step):
+        painter.drawLine(0, y, width, y)
+    painter.end()
+    return pix
+
+
 class LegendWidget(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setMaximumWidth(220)
         layout = QVBoxLayout(self)
         title = QLabel("Map Legend")
-        f = QFont()
-        f.setBold(True)
-        title.setFont(f)
+        title.setFont(_LABEL_FONT_BOLD)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         self.list = QListWidget()
+        # All rows are one icon plus one line of text
+        self.list.setUniformItemSizes(True)
         layout.addWidget(self.list)
-        for name, color in [
-            ("Robot", OBJECT_COLORS["robot"]),
-            ("Obstacle", OBJECT_COLORS["obstacle"]),
-            ("Waypoint", OBJECT_COLORS["waypoint"]),
-        ]:
-            item = QListWidgetItem(name)
+        for name, color, icon in _get_legend_icons():
+            item = QListWidgetItem(icon, name)
             item.setForeground(color)
             self.list.addItem(item)
 
@@ -119,21 +461,69 @@ class LegendWidget(QWidget):
 
 class EnhancedSimulatorView(QGraphicsView):
     robot_moved = pyqtSignal(float, float, float)
+    objects_changed = pyqtSignal(int)
 
     def __init__(
         self,
         game_map: GameMap,
         *,
         mat_path: Optional[Path] = None,
+        use_opengl: Optional[bool] = None,
         parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self._game_map = game_map
+        if use_opengl is None:
+            use_opengl = (
+                os.environ.get("FLL_SIM_OPENGL") == "1"
+                and os.environ.get("FLL_SIM_HEADLESS") != "1"
+            )
+        self._uses_opengl = use_opengl and self._enable_opengl_viewport()
         self._scene = QGraphicsScene(self)
+        # No index while the map is being populated; the BSP tree is built
+        # once, after the last map element is added.
+        self._scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self._scene)
+        # A robot move only dirties the union of its old and new bounds;
+        # GL viewports cannot do partial updates and must repaint fully.
+        self.setViewportUpdateMode(
+            QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            if self._uses_opengl
+            else QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        )
         self._robot_item: Optional[RobotGraphicsItem] = None
-        self._object_items: List[QGraphicsItem] = []
-        self._path_items: List[QGraphicsItem] = []
+        # Static map decorations live under a single group so they can be
+        # hidden in one operation; the waypoint path is a single layer item.
+        self._static_group = QGraphicsItemGroup()
+        # Decorations only: never selectable, movable or a mouse target
+        self._static_group.setFlags(QGraphicsItem.GraphicsItemFlag(0))
+        self._static_group.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self._scene.addItem(self._static_group)
+        self._waypoints = WaypointLayer()
+        self._waypoints.setZValue(50)
+        self._scene.addItem(self._waypoints)
+        # Counted from the map up front; the scene items are built later
+        self._object_count = len(game_map.obstacles) + len(
+            game_map.color_zones
+        )
+        # Map layers and the geometry they were last built from
+        self._labels: Optional[LabelLayer] = None
+        self._obstacles: Optional[ShapeBatchItem] = None
+        self._zones: Optional[ShapeBatchItem] = None
+        self._obstacle_sig: List[Tuple[float, float, float, float, float]] = []
+        self._zone_sig: List[tuple] = []
+        # Zone geometry columns for zone_hit, built on the first query
+        self._zone_columns: Optional[Tuple[np.ndarray, ...]] = None
+        self._pending_pose: Optional[Tuple[float, float, float]] = None
+        self._applied_pose: Optional[Tuple[float, float, float]] = None
+        self._pose_timer = QTimer(self)
+        self._pose_timer.setSingleShot(True)
+        self._pose_timer.setInterval(POSE_REFRESH_MS)
+        self._pose_timer.timeout.connect(self._flush_pose)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_REFIT_MS)
+        self._resize_timer.timeout.connect(self._do_fit)
 
         w_mm = game_map.config.width
         h_mm = game_map.config.height
@@ -147,8 +537,11 @@ class EnhancedSimulatorView(QGraphicsView):
         self._bg_item = self._background.create_graphics_item()
         self._scene.addItem(self._bg_item)
 
-        # Objects
-        self._add_map_objects()
+        # Objects: the robot is needed immediately, map elements are built
+        # in chunks after the first show so the window paints right away.
+        self._pending_elements: Optional[Iterator[bool]] = (
+            self._map_element_steps()
+        )
         self._add_robot()
 
         self.setRenderHints(
@@ -156,74 +549,182 @@ class EnhancedSimulatorView(QGraphicsView):
             | QPainter.RenderHint.SmoothPixmapTransform
         )
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
-        self.fitInView(
-            self._bg_item.boundingRect(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-        )
+        self._do_fit()
+
+    def _enable_opengl_viewport(self) -> bool:
+        """Render through a QOpenGLWidget; False if Qt lacks GL support."""
+        try:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+        except ImportError:
+            return False
+        gl = QOpenGLWidget()
+        # Multisampling keeps edges smooth; the raster Antialiasing hint
+        # does not apply to a GL surface.
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)
+        gl.setFormat(fmt)
+        self.setViewport(gl)
+        return True
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._pending_elements is not None:
+            QTimer.singleShot(0, self._build_next_chunk)
+
+    def _build_next_chunk(self) -> None:
+        """Run up to MAP_BUILD_CHUNK map build steps, then yield.
+
+        A step that yields True has just finished an expensive phase, so
+        the rest of the build waits for the next event-loop turn.
+        """
+        steps = self._pending_elements
+        if steps is None:
+            return
+        for _ in range(MAP_BUILD_CHUNK):
+            step = next(steps, StopIteration)
+            if step is StopIteration:
+                self._pending_elements = None
+                self._scene.setItemIndexMethod(
+                    QGraphicsScene.ItemIndexMethod.BspTreeIndex
+                )
+                # Only applies once the index is BSP; 0 lets Qt pick the
+                # depth from the item count
+                self._scene.setBspTreeDepth(0)
+                return
+            if step:
+                break
+        QTimer.singleShot(0, self._build_next_chunk)
+
+    def _map_element_steps(self) -> Iterator[bool]:
+        """Build obstacles, zones, labels and grid in resumable steps.
+
+        Yields False after each cheap per-element step and True after
+        each expensive phase (path builds, labels, grouping, grid).
+        """
+        labels = self._labels = LabelLayer(self._scene.sceneRect())
+        labels.setZValue(15)
+        labels.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
-    def _add_map_objects(self) -> None:
         # Obstacles as rectangles centered at (x, y)
-        for i, ob in enumerate(self._game_map.obstacles):
-            w = float(ob.width)
-            h = float(ob.height)
-            rect = QGraphicsRectItem(-w / 2, -h / 2, w, h)
-            rect.setPos(ob.x, ob.y)
-            if getattr(ob, "angle", 0.0):
-                rect.setRotation(ob.angle)
-            rect.setBrush(QBrush(OBJECT_COLORS["obstacle"]))
-            rect.setPen(QPen(QColor(0, 0, 0), 2))
-            rect.setZValue(10)
-            self._scene.addItem(rect)
-            self._object_items.append(rect)
-
-            lbl = QGraphicsTextItem(f"Obs {i+1}")
-            lbl.setDefaultTextColor(QColor(0, 0, 0))
-            lbl.setPos(ob.x - w / 2, ob.y - h / 2 - 18)
-            lbl.setZValue(15)
-            self._scene.addItem(lbl)
-            self._object_items.append(lbl)
+        obstacles = self._obstacles = ShapeBatchItem(_BLACK_PEN_2)
+        obstacles.setZValue(10)
+        shapes = []
+        for ob in self._game_map.obstacles:
+            shapes.append(_shape_of(ob))
+            yield False
+        obstacles.set_shapes(shapes, [_OBSTACLE_BRUSH] * len(shapes))
+        self._obstacle_sig = shapes
+        yield True
 
         # Color zones as rectangles centered at (x, y)
-        for i, z in enumerate(self._game_map.color_zones):
-            w = float(z.width)
-            h = float(z.height)
-            rect = QGraphicsRectItem(-w / 2, -h / 2, w, h)
-            rect.setPos(z.x, z.y)
-            if getattr(z, "angle", 0.0):
-                rect.setRotation(z.angle)
-            # prefer sensor_value mapping; else explicit color; else default
-            sensor_key = getattr(z, "sensor_value", "") or ""
-            qcol = SENSOR_COLOR_MAP.get(sensor_key, None)
-            if qcol is None:
-                col = getattr(z, "color", None)
-                if isinstance(col, (list, tuple)) and 3 <= len(col) <= 4:
-                    if len(col) == 3:
-                        qcol = QColor(col[0], col[1], col[2])
-                    else:
-                        qcol = QColor(col[0], col[1], col[2], col[3])
-                else:
-                    qcol = QColor(100, 100, 255, 128)
-            rect.setBrush(QBrush(qcol))
-            rect.setPen(QPen(QColor(255, 255, 255), 2))
-            rect.setZValue(5)
-            self._scene.addItem(rect)
-            self._object_items.append(rect)
-
-            lbl = QGraphicsTextItem(f"Zone {i+1}")
-            lbl.setDefaultTextColor(QColor(0, 0, 0))
-            lbl.setPos(z.x - w / 2, z.y - h / 2 - 18)
-            lbl.setZValue(15)
-            self._scene.addItem(lbl)
-            self._object_items.append(lbl)
-
-        # Light grid, every 300mm
-        pen = QPen(QColor(200, 200, 200, 100), 1, Qt.PenStyle.DashLine)
-        total_w = int(self._game_map.config.width)
-        total_h = int(self._game_map.config.height)
-        for x in range(300, total_w, 300):
-            self._scene.addLine(x, 0, x, total_h, pen)
-        for y in range(300, total_h, 300):
-            self._scene.addLine(0, y, total_w, y, pen)
+        zones = self._zones = ShapeBatchItem(_WHITE_PEN_2)
+        zones.setZValue(5)
+        brushes = []
+        sig = []
+        for z in self._game_map.color_zones:
+            sig.append((_shape_of(z), _zone_style(z)))
+            brushes.append(_zone_brush(z))
+            yield False
+        zones.set_shapes([shape for shape, _ in sig], brushes)
+        self._zone_sig = sig
+        self._zone_columns = None
+        yield True
+
+        self._add_map_labels()
+        yield True
+
+        for batch in (zones, obstacles):
+            batch.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            self._static_group.addToGroup(batch)
+        self._static_group.addToGroup(labels)
+        yield True
+
+        self._add_coordinate_grid()
+
+    def _add_map_labels(self) -> None:
+        labels = self._labels
+        for prefix, shapes in (
+            ("Obs", self._obstacle_sig),
+            ("Zone", [shape for shape, _ in self._zone_sig]),
+        ):
+            for i, (x, y, w, h, _) in enumerate(shapes):
+                labels.add_label(
+                    x - w / 2, y - h / 2 - 18, f"{prefix} {i+1}", _BLACK_TEXT
+                )
+
+    def _get_zone_columns(self) -> Tuple[np.ndarray, ...]:
+        """Zone geometry as contiguous columns for zone_hit.
+
+        Built from the game map on first use and dropped whenever the map
+        build or refresh_map_objects sees the zones change.
+        """
+        if self._zone_columns is None:
+            geom = np.asarray(
+                [_shape_of(z) for z in self._game_map.color_zones],
+                dtype=np.float64,
+            ).reshape(-1, 5)
+            self._zone_columns = tuple(
+                np.ascontiguousarray(geom[:, k]) for k in range(5)
+            )
+        return self._zone_columns
+
+    def sample_zone_at(self, x: float, y: float):
+        """Return the colour zone under scene point (x, y), or None."""
+        index = zone_hit(*self._get_zone_columns(), float(x), float(y))
+        if index < 0:
+            return None
+        return self._game_map.color_zones[index]
+
+    def refresh_map_objects(self) -> None:
+        """Re-sync obstacle and zone drawing with the game map.
+
+        Only layers whose geometry or colours changed are rebuilt; scene
+        items are reused rather than removed and re-added.
+        """
+        if self._pending_elements is not None or self._labels is None:
+            return  # the initial build will pick up the current map
+        changed = False
+        shapes = [_shape_of(ob) for ob in self._game_map.obstacles]
+        if shapes != self._obstacle_sig:
+            self._obstacles.set_shapes(
+                shapes, [_OBSTACLE_BRUSH] * len(shapes)
+            )
+            self._obstacle_sig = shapes
+            changed = True
+
+        zones = self._game_map.color_zones
+        sig = [(_shape_of(z), _zone_style(z)) for z in zones]
+        if sig != self._zone_sig:
+            # _zone_brush shares brushes by colour across all views
+            brushes = [_zone_brush(z) for z in zones]
+            self._zones.set_shapes([shape for shape, _ in sig], brushes)
+            self._zone_sig = sig
+            self._zone_columns = None
+            changed = True
+
+        if changed:
+            self._labels.clear()
+            self._add_map_labels()
+            # The robot label is the one object outside the two batches
+            self._object_count = len(self._obstacles) + len(self._zones) + 1
+            self.objects_changed.emit(self._object_count)
+
+    def _add_coordinate_grid(self) -> None:
+        """Add a light grid every 300mm as a single pre-rendered pixmap."""
+        grid_item = QGraphicsPixmapItem(
+            _render_grid_pixmap(
+                int(self._game_map.config.width),
+                int(self._game_map.config.height),
+                300,
+            )
+        )
+        grid_item.setZValue(-10)
+        grid_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # Hit tests would otherwise build a shape from the pixmap mask
+        grid_item.setShapeMode(
+            QGraphicsPixmapItem.ShapeMode.BoundingRectShape
+        )
+        self._static_group.addToGroup(grid_item)
 
     def _add_robot(self) -> None:
         x = self._game_map.config.width / 4
@@ -231,44 +732,94 @@ class EnhancedSimulatorView(QGraphicsView):
         self._robot_item = RobotGraphicsItem(x, y, 180, 200)
         self._scene.addItem(self._robot_item)
 
-        lbl = QGraphicsTextItem("Robot")
-        lbl.setDefaultTextColor(QColor(0, 100, 0))
-        f = lbl.font()
-        f.setBold(True)
-        lbl.setFont(f)
+        lbl = FastLabel("Robot", _ROBOT_LABEL_COLOR, _LABEL_FONT_BOLD)
         lbl.setPos(x - 20, y + 120)
         lbl.setZValue(105)
+        lbl.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self._scene.addItem(lbl)
-        self._object_items.append(lbl)
+        self._object_count += 1
 
     def update_robot_position(
         self, x: float, y: float, angle: float = 0
     ) -> None:
+        """Queue a robot pose; it is drawn on the next display frame."""
+        self._pending_pose = (x, y, angle)
+        if not self._pose_timer.isActive():
+            self._pose_timer.start()
+
+    def _flush_pose(self) -> None:
+        """Apply the latest queued robot pose, if it changed."""
+        pose = self._pending_pose
+        self._pending_pose = None
+        if pose is None or pose == self._applied_pose:
+            return
         if self._robot_item:
-            self._robot_item.update_position(x, y, angle)
-            self.robot_moved.emit(x, y, angle)
+            self._applied_pose = pose
+            self._robot_item.update_position(*pose)
+            self.robot_moved.emit(*pose)
+
+    def add_waypoint(self, x: float, y: float) -> None:
+        """Mark a point on the robot path, joined to the previous one."""
+        self._waypoints.add_point(x, y)
+
+    def clear_path(self) -> None:
+        """Remove all waypoints."""
+        self._waypoints.clear()
 
     def toggle_background_visibility(self, visible: bool) -> None:
         self._bg_item.setVisible(visible)
 
     def get_object_count(self) -> int:
-        return len(self._object_items)
+        return self._object_count
 
     def get_background_item(self) -> QGraphicsItem:
         """Return the background graphics item."""
         return self._bg_item
 
     def resizeEvent(self, event) -> None:
-        """Handle window resize events."""
+        """Refit once the window has stopped resizing."""
         super().resizeEvent(event)
-        if self._bg_item is not None:
-            self.fitInView(self._bg_item, Qt.AspectRatioMode.KeepAspectRatio)
+        self._resize_timer.start()
+
+    def fit_to_background(self) -> None:
+        """Fit the view to the background mat immediately."""
+        self._resize_timer.stop()
+        self._do_fit()
+
+    def _do_fit(self) -> None:
+        self.fitInView(self._bg_item, Qt.AspectRatioMode.KeepAspectRatio)
 
     def set_scale_mode(self, mode: str) -> None:
         """Set background scale mode and refit view."""
         self._background.set_scale_mode(mode)
-        if self._bg_item is not None:
-            self.fitInView(self._bg_item, Qt.AspectRatioMode.KeepAspectRatio)
+        self._do_fit()
+
+
+class _FileIOSignals(QObject):
+    finished = pyqtSignal(str, str)
+    error = pyqtSignal(str)
+
+
+class _FileIOWorker(QRunnable):
+    """Read (text is None) or write a UTF-8 text file on a pool thread."""
+
+    def __init__(self, path: str, text: Optional[str] = None) -> None:
+        super().__init__()
+        self.path = path
+        self.text = text
+        self.signals = _FileIOSignals()
+
+    def run(self) -> None:
+        try:
+            if self.text is None:
+                data = Path(self.path).read_text(encoding="utf-8")
+            else:
+                Path(self.path).write_text(self.text, encoding="utf-8")
+                data = self.text
+        except (OSError, UnicodeDecodeError) as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.path, data)
 
 
 class FLLSimMainWindow(QMainWindow):
@@ -278,6 +829,14 @@ class FLLSimMainWindow(QMainWindow):
         super().__init__()
         self._game_map = game_map
         self._mat_path = mat_path
+        self._io_workers: List[_FileIOWorker] = []
+        self._robot_update_pending = False
+        # Widgets on lazily built tabs; None until the tab is first shown
+        self._robot_x: Optional[QSpinBox] = None
+        self._robot_y: Optional[QSpinBox] = None
+        self._robot_angle: Optional[QSpinBox] = None
+        self._output: Optional[QPlainTextEdit] = None
+        self._pending_output: List[str] = []
 
         self.setWindowTitle("FLL-Sim - Enhanced Simulator")
         self.resize(1400, 900)
@@ -315,6 +874,7 @@ class FLLSimMainWindow(QMainWindow):
         # Legend
         legend = LegendWidget()
         legend.update_object_count(self._view.get_object_count())
+        self._view.objects_changed.connect(legend.update_object_count)
 
         splitter_left = QSplitter(Qt.Orientation.Horizontal)
         splitter_left.addWidget(left)
@@ -340,36 +900,21 @@ class FLLSimMainWindow(QMainWindow):
         bar.addWidget(stop_btn)
         bar.addStretch(1)
         code_layout.addLayout(bar)
-        self._editor = QTextEdit()
+        self._editor = QPlainTextEdit()
+        self._editor.setFont(_get_editor_font())
+        self._editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._editor.setPlainText(_NEW_PROGRAM_TEMPLATE)
         code_layout.addWidget(self._editor)
         tabs.addTab(code_tab, "Robot Code")
 
-        # Robot config tab
-        cfg_tab = QWidget()
-        cfg_layout = QFormLayout(cfg_tab)
-        self._robot_x = QSpinBox()
-        self._robot_y = QSpinBox()
-        self._robot_angle = QSpinBox()
-        self._robot_x.setRange(0, int(self._game_map.config.width))
-        self._robot_y.setRange(0, int(self._game_map.config.height))
-        self._robot_angle.setRange(-180, 180)
-        self._robot_x.setValue(int(self._game_map.config.width / 4))
-        self._robot_y.setValue(int(self._game_map.config.height / 2))
-        self._robot_angle.setValue(0)
-        cfg_layout.addRow("Robot X (mm)", self._robot_x)
-        cfg_layout.addRow("Robot Y (mm)", self._robot_y)
-        cfg_layout.addRow("Angle (deg)", self._robot_angle)
-        tabs.addTab(cfg_tab, "Robot Config")
-
-        # Output tab
-        out_tab = QWidget()
-        out_layout = QVBoxLayout(out_tab)
-        out_layout.addWidget(QLabel("Simulation Output:"))
-        self._output = QTextEdit()
-        self._output.setReadOnly(True)
-        self._output.setMaximumHeight(220)
-        out_layout.addWidget(self._output)
-        tabs.addTab(out_tab, "Output")
+        # Config and output tabs start as empty pages and are filled in the
+        # first time they are shown.
+        self._lazy_tabs = {
+            tabs.addTab(QWidget(), "Robot Config"): self._build_config_tab,
+            tabs.addTab(QWidget(), "Output"): self._build_output_tab,
+        }
+        tabs.currentChanged.connect(self._on_tab_changed)
+        self._tabs = tabs
 
         right_layout.addWidget(tabs)
 
@@ -395,31 +940,55 @@ class FLLSimMainWindow(QMainWindow):
         )
         zoom_in.clicked.connect(lambda: self._view.scale(1.2, 1.2))
         zoom_out.clicked.connect(lambda: self._view.scale(0.8, 0.8))
-        fit_view.clicked.connect(
-            lambda: self._view.fitInView(
-                self._view.get_background_item(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-            )
-        )
+        fit_view.clicked.connect(self._fit_view)
         load_btn.clicked.connect(self._load_code)
         save_btn.clicked.connect(self._save_code)
         run_btn.clicked.connect(self._run_code)
         stop_btn.clicked.connect(self._stop_code)
-        self._robot_x.valueChanged.connect(
-            lambda v: self._view.update_robot_position(
-                v, self._robot_y.value(), self._robot_angle.value()
-            )
-        )
-        self._robot_y.valueChanged.connect(
-            lambda v: self._view.update_robot_position(
-                self._robot_x.value(), v, self._robot_angle.value()
-            )
-        )
-        self._robot_angle.valueChanged.connect(
-            lambda v: self._view.update_robot_position(
-                self._robot_x.value(), self._robot_y.value(), v
-            )
-        )
+
+    def _build_config_tab(self, page: QWidget) -> None:
+        cfg_layout = QFormLayout(page)
+        self._robot_x = QSpinBox()
+        self._robot_y = QSpinBox()
+        self._robot_angle = QSpinBox()
+        self._robot_x.setRange(0, int(self._game_map.config.width))
+        self._robot_y.setRange(0, int(self._game_map.config.height))
+        self._robot_angle.setRange(-180, 180)
+        self._robot_x.setValue(int(self._game_map.config.width / 4))
+        self._robot_y.setValue(int(self._game_map.config.height / 2))
+        self._robot_angle.setValue(0)
+        cfg_layout.addRow("Robot X (mm)", self._robot_x)
+        cfg_layout.addRow("Robot Y (mm)", self._robot_y)
+        cfg_layout.addRow("Angle (deg)", self._robot_angle)
+        for spin in (self._robot_x, self._robot_y, self._robot_angle):
+            spin.valueChanged.connect(self._queue_robot_update)
+
+    def _build_output_tab(self, page: QWidget) -> None:
+        out_layout = QVBoxLayout(page)
+        out_layout.addWidget(QLabel("Simulation Output:"))
+        self._output = QPlainTextEdit()
+        self._output.setReadOnly(True)
+        self._output.setUndoRedoEnabled(False)
+        # Oldest lines are dropped once the log reaches this many
+        self._output.setMaximumBlockCount(OUTPUT_MAX_LINES)
+        self._output.setMaximumHeight(220)
+        out_layout.addWidget(self._output)
+        for line in self._pending_output:
+            self._output.appendPlainText(line)
+        self._pending_output.clear()
+
+    def _on_tab_changed(self, index: int) -> None:
+        build = self._lazy_tabs.pop(index, None)
+        if build is not None:
+            build(self._tabs.widget(index))
+
+    def _append_output(self, text: str) -> None:
+        """Append to the output tab, buffering until it is first shown."""
+        if self._output is None:
+            self._pending_output.append(text)
+            del self._pending_output[:-OUTPUT_MAX_LINES]
+        else:
+            self._output.appendPlainText(text)
 
     def _build_menu(self) -> None:
         m = self.menuBar()
@@ -447,12 +1016,7 @@ class FLLSimMainWindow(QMainWindow):
         if view_menu is None:
             return
         act_fit = QAction("&Fit to View", self)
-        act_fit.triggered.connect(
-            lambda: self._view.fitInView(
-                self._view.get_background_item(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-            )
-        )
+        act_fit.triggered.connect(self._fit_view)
         view_menu.addAction(act_fit)
         view_menu.addSeparator()
 
@@ -501,24 +1065,17 @@ class FLLSimMainWindow(QMainWindow):
 
     # Actions
     def _new_program(self) -> None:
-        self._editor.setPlainText(
-            "# New Robot Program\nprint('Hello, FLL!')\n"
-        )
+        self._editor.setPlainText(_NEW_PROGRAM_TEMPLATE)
 
     def _load_code(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
             self, "Load Robot Code", "", "Python Files (*.py);;All Files (*)"
         )
         if path:
-            try:
-                self._editor.setPlainText(
-                    Path(path).read_text(encoding="utf-8")
-                )
-                self.status.showMessage(f"Loaded: {path}")
-            except (OSError, UnicodeDecodeError) as e:
-                QMessageBox.warning(
-                    self, "Error", f"Failed to load code: {e}"
-                )
+            self.status.showMessage(f"Loading: {path}")
+            self._start_io(
+                _FileIOWorker(path), self._on_code_loaded, self._on_load_error
+            )
 
     def _save_code(self) -> None:
         path, _ = QFileDialog.getSaveFileName(
@@ -528,31 +1085,75 @@ class FLLSimMainWindow(QMainWindow):
             "Python Files (*.py);;All Files (*)",
         )
         if path:
-            try:
-                Path(path).write_text(
-                    self._editor.toPlainText(), encoding="utf-8"
-                )
-                self.status.showMessage(f"Saved: {path}")
-            except OSError as e:
-                QMessageBox.warning(
-                    self, "Error", f"Failed to save code: {e}"
-                )
+            self.status.showMessage(f"Saving: {path}")
+            self._start_io(
+                _FileIOWorker(path, self._editor.toPlainText()),
+                self._on_code_saved,
+                self._on_save_error,
+            )
+
+    def _start_io(self, worker: _FileIOWorker, on_done, on_error) -> None:
+        """Run a file worker on the global pool; results arrive queued."""
+        def _release(*_args) -> None:
+            self._io_workers.remove(worker)
+
+        # Keep the worker (and its signals object) alive until it reports
+        self._io_workers.append(worker)
+        worker.signals.finished.connect(on_done)
+        worker.signals.error.connect(on_error)
+        worker.signals.finished.connect(_release)
+        worker.signals.error.connect(_release)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_code_loaded(self, path: str, text: str) -> None:
+        self._editor.setPlainText(text)
+        self.status.showMessage(f"Loaded: {path}")
+
+    def _on_code_saved(self, path: str, _text: str) -> None:
+        self.status.showMessage(f"Saved: {path}")
+
+    def _on_load_error(self, message: str) -> None:
+        QMessageBox.warning(self, "Error", f"Failed to load code: {message}")
+
+    def _on_save_error(self, message: str) -> None:
+        QMessageBox.warning(self, "Error", f"Failed to save code: {message}")
 
     def _run_code(self) -> None:
-        self._output.append(">>> Running robot program...")
+        self._append_output(">>> Running robot program...")
         self.status.showMessage("Running robot code…")
-        self._output.append("Program execution completed.")
+        self._append_output("Program execution completed.")
 
     def _stop_code(self) -> None:
-        self._output.append(">>> Execution stopped by user")
+        self._append_output(">>> Execution stopped by user")
         self.status.showMessage("Code execution stopped")
 
+    def _queue_robot_update(self) -> None:
+        """Collapse spinbox changes in one event-loop turn into one move."""
+        if not self._robot_update_pending:
+            self._robot_update_pending = True
+            QTimer.singleShot(0, self._flush_robot_update)
+
+    def _flush_robot_update(self) -> None:
+        self._robot_update_pending = False
+        self._view.update_robot_position(
+            self._robot_x.value(),
+            self._robot_y.value(),
+            self._robot_angle.value(),
+        )
+
     def _reset_robot(self) -> None:
         x = int(self._game_map.config.width / 4)
         y = int(self._game_map.config.height / 2)
-        self._robot_x.setValue(x)
-        self._robot_y.setValue(y)
-        self._robot_angle.setValue(0)
+        if self._robot_x is not None:
+            # Sync the spinboxes silently; the view gets one update below
+            for spin, value in (
+                (self._robot_x, x),
+                (self._robot_y, y),
+                (self._robot_angle, 0),
+            ):
+                spin.blockSignals(True)
+                spin.setValue(value)
+                spin.blockSignals(False)
         self._view.update_robot_position(x, y, 0)
         self.status.showMessage("Robot reset")
 
@@ -565,6 +1166,9 @@ class FLLSimMainWindow(QMainWindow):
             "rendered as rectangles with accurate sizing.",
         )
 
+    def _fit_view(self) -> None:
+        self._view.fit_to_background()
+
     def _set_scale_mode(self, mode: str) -> None:
         """Set the background scale mode and update the status."""
         self._view.set_scale_mode(mode)
@@ -8,53 +8,143 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from PyQt6 import QtCore, QtGui, QtWidgets
 
-# Ensure src on path when launched directly
-project_root = Path(__file__).resolve().parents[3]
-sys.path.insert(0, str(project_root / "src"))
+# Ensure src on path when launched directly from a checkout
+try:
+    import fll_sim  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "src"))
+
+
+# One simulation at a time; the worker thread is created on first use
+_SIM_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fll-sim")
+
+# SDL must own the main thread on macOS, so the simulator gets its own
+# process there instead of running on the pool thread
+_SIM_IN_PROCESS = sys.platform != "darwin"
+
+# Seconds to wait for a running simulation when the window closes
+_CLOSE_TIMEOUT = 5.0
+
+# Help > About text, built once
+_ABOUT_HTML = (
+    "<h3>FLL-Sim - First Lego League Simulator</h3>\n"
+    "<p>Simulation environment for practicing FLL missions with a "
+    "virtual robot.</p>\n"
+    "<p>Launches the simulator module and provides basic tabs for "
+    "getting started.</p>\n"
+)
+
+_APP_ICON_PATH = Path(__file__).parent / "icons" / "app.png"
+
+
+@lru_cache(maxsize=None)
+def _app_icon() -> QtGui.QIcon:
+    # Package icon or themed fallback, looked up once per process
+    if _APP_ICON_PATH.is_file():
+        return QtGui.QIcon(str(_APP_ICON_PATH))
+    return QtGui.QIcon.fromTheme("applications-education")
+
+
+def _run_simulation(stop_event: threading.Event, **sim_kwargs: Any) -> None:
+    # Imported here so pygame is only loaded once a simulation starts
+    from fll_sim.core.simulator import run as sim_run
+
+    sim_run(stop_event=stop_event, **sim_kwargs)
+
+
+def _run_simulation_process(
+    stop_event: threading.Event, **sim_kwargs: Any
+) -> None:
+    import fll_sim
+
+    cmd = [sys.executable, "-m", "fll_sim.core.simulator"]
+    for key, value in sim_kwargs.items():
+        flag = "--" + key.replace("_", "-")
+        if value is True:
+            cmd.append(flag)
+        elif value not in (None, False, ""):
+            cmd += [flag, str(value)]
+    # The child must import the same fll_sim, even from a plain checkout
+    env = os.environ.copy()
+    src = str(Path(fll_sim.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (src, env.get("PYTHONPATH", "")) if p
+    )
+    proc = subprocess.Popen(cmd, env=env)
+    try:
+        while proc.poll() is None:
+            if stop_event.wait(0.1):
+                proc.terminate()
+                break
+        try:
+            proc.wait(timeout=_CLOSE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    finally:
+        stopped = stop_event.is_set()
+        stop_event.set()
+    if proc.returncode and not stopped:
+        raise RuntimeError(f"Simulator exited with code {proc.returncode}")
+
 
+class SimulationRunner(QtCore.QObject):
+    """Run the simulator on a pool thread and report back via signals."""
 
-class SimulationThread(QtCore.QThread):
     status_update = QtCore.pyqtSignal(str)
     finished = QtCore.pyqtSignal()
 
-    def __init__(self, cmd: list[str]):
+    def __init__(self, **sim_kwargs: Any):
         super().__init__()
-        self.cmd = cmd
-        self.proc: subprocess.Popen | None = None
+        self.sim_kwargs = sim_kwargs
+        self._stop_event = threading.Event()
+        self._future: Future | None = None
+
+    def start(self) -> None:
+        self.status_update.emit("Starting simulation…")
+        if _SIM_IN_PROCESS:
+            target = _run_simulation
+        else:
+            target = _run_simulation_process
+        self._future = _SIM_EXECUTOR.submit(
+            target, self._stop_event, **self.sim_kwargs
+        )
+        self._future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future) -> None:
+        # Runs on the pool thread; queued signals hop back to the GUI thread
+        exc = future.exception()
+        if exc is None:
+            self.status_update.emit("Simulation completed successfully")
+        elif isinstance(exc, (OSError, ValueError, RuntimeError)):
+            self.status_update.emit(f"Simulation error: {exc}")
+        else:
+            self.status_update.emit(f"Simulation failed: {exc!r}")
+        self.finished.emit()
 
-    def run(self) -> None:  # noqa: D401
-        try:
-            self.status_update.emit("Starting simulation…")
-            env = os.environ.copy()
-            env["PYTHONPATH"] = (
-                f"{project_root / 'src'}:" + env.get("PYTHONPATH", "")
-            )
-            self.proc = subprocess.Popen(
-                self.cmd,
-                cwd=str(project_root),
-                env=env,
-            )
-            self.proc.wait()
-            rc = self.proc.returncode if self.proc else -1
-            if rc == 0:
-                self.status_update.emit("Simulation completed successfully")
-            else:
-                self.status_update.emit(f"Simulation exited with code {rc}")
-        except (OSError, ValueError, RuntimeError) as e:
-            self.status_update.emit(f"Simulation error: {e}")
-        finally:
-            self.finished.emit()
+    def is_running(self) -> bool:
+        return self._future is not None and not self._future.done()
 
     def stop(self) -> None:
-        if self.proc and self.proc.poll() is None:
-            self.proc.terminate()
+        if not self._stop_event.is_set():
+            self._stop_event.set()
             self.status_update.emit("Simulation stopping…")
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the simulation has ended; False on timeout."""
+        if self._future is None:
+            return True
+        done, _ = wait([self._future], timeout=timeout)
+        return bool(done)
+
 
 class FLLSimMainWindow(QtWidgets.QMainWindow):
     def __init__(self) -> None:
@@ -62,15 +152,11 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
         self.setWindowTitle("FLL-Sim - First Lego League Simulator")
         self.resize(1200, 800)
 
-        # Icon: package icon or themed fallback
-        icon_path = Path(__file__).parent / "icons" / "app.png"
-        if icon_path.exists():
-            self.setWindowIcon(QtGui.QIcon(str(icon_path)))
-        else:
-            self.setWindowIcon(QtGui.QIcon.fromTheme("applications-education"))
+        self.setWindowIcon(_app_icon())
 
-        # Predefine thread attribute for linters
-        self.sim_thread: SimulationThread | None = None
+        # Predefine runner attribute for linters
+        self.sim_runner: SimulationRunner | None = None
+        self.missions_list: QtWidgets.QListWidget | None = None
 
         self._build_ui()
 
@@ -101,13 +187,13 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
         v.addWidget(self.progress)
         self.tabs.addTab(quick, "Quick Start")
 
-        # Missions tab (placeholder)
-        missions = QtWidgets.QWidget(self)
-        mv = QtWidgets.QVBoxLayout(missions)
-        mv.addWidget(QtWidgets.QLabel("Available Missions"))
-        self.missions_list = QtWidgets.QListWidget(missions)
-        mv.addWidget(self.missions_list)
-        self.tabs.addTab(missions, "Missions")
+        # Missions tab (placeholder), filled in on first visit
+        self._lazy_tabs = {
+            self.tabs.addTab(
+                QtWidgets.QWidget(self), "Missions"
+            ): self._build_missions_tab,
+        }
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Status bar
         self.status_bar = QtWidgets.QStatusBar(self)
@@ -117,8 +203,16 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
         # Menu bar
         self._build_menus()
 
-        # Keyboard shortcuts
-        self._build_shortcuts()
+    def _on_tab_changed(self, index: int) -> None:
+        build = self._lazy_tabs.pop(index, None)
+        if build is not None:
+            build(self.tabs.widget(index))
+
+    def _build_missions_tab(self, page: QtWidgets.QWidget) -> None:
+        mv = QtWidgets.QVBoxLayout(page)
+        mv.addWidget(QtWidgets.QLabel("Available Missions"))
+        self.missions_list = QtWidgets.QListWidget(page)
+        mv.addWidget(self.missions_list)
 
     def _build_menus(self) -> None:
         menubar = self.menuBar()
@@ -152,7 +246,7 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
             "&Start",
             self,
         )
-        act_start.setShortcut(QtGui.QKeySequence("F5"))
+        act_start.setShortcut(QtGui.QKeySequence(QtCore.Qt.Key.Key_F5))
         act_start.triggered.connect(self._start_simulation)
         sim_menu.addAction(act_start)
 
@@ -161,7 +255,9 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
             "St&op",
             self,
         )
-        act_stop.setShortcut(QtGui.QKeySequence("Shift+F5"))
+        act_stop.setShortcut(
+            QtGui.QKeySequence(QtCore.Qt.Modifier.SHIFT | QtCore.Qt.Key.Key_F5)
+        )
         act_stop.triggered.connect(self._stop_simulation)
         sim_menu.addAction(act_stop)
 
@@ -174,41 +270,37 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
         act_about.triggered.connect(self._show_about)
         help_menu.addAction(act_about)
 
-    def _build_shortcuts(self) -> None:
-        # Already set via menu actions for common ones; add more if needed
-        pass
-
     # --- Actions ---
     def _start_simulation(self) -> None:
-        if self.sim_thread and self.sim_thread.isRunning():
+        if self.sim_runner and self.sim_runner.is_running():
             QtWidgets.QMessageBox.warning(
                 self,
                 "Warning",
                 "Simulation is already running.",
             )
             return
-        cmd = [
-            sys.executable,
-            "-m",
-            "fll_sim.core.simulator",
-            "--profile",
-            "beginner",
-            "--robot",
-            "standard_fll",
-            "--season",
-            "2024",
-        ]
-        self.sim_thread = SimulationThread(cmd)
-        self.sim_thread.status_update.connect(self.status_bar.showMessage)
-        self.sim_thread.finished.connect(
-            lambda: self._update_status("Simulation finished")
+        if self.sim_runner is not None:
+            # Finished runners are not reused; release the old QObject
+            self.sim_runner.deleteLater()
+        self.sim_runner = SimulationRunner(
+            profile="beginner", robot="standard_fll", season="2024"
         )
-        self.sim_thread.start()
+        # Emitted from the pool thread; always deliver via the event loop
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self.sim_runner.status_update.connect(
+            self.status_bar.showMessage, queued
+        )
+        self.sim_runner.finished.connect(self._on_simulation_finished, queued)
+        self.sim_runner.start()
         self._update_status("Simulation started")
 
+    @QtCore.pyqtSlot()
+    def _on_simulation_finished(self) -> None:
+        self._update_status("Simulation finished")
+
     def _stop_simulation(self) -> None:
-        if self.sim_thread and self.sim_thread.isRunning():
-            self.sim_thread.stop()
+        if self.sim_runner and self.sim_runner.is_running():
+            self.sim_runner.stop()
         else:
             self._update_status("No simulation is running")
 
@@ -222,18 +314,15 @@ class FLLSimMainWindow(QtWidgets.QMainWindow):
         if path:
             self._update_status(f"Loaded configuration: {path}")
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Stop the simulator before the window (and the app) goes away
+        if self.sim_runner and self.sim_runner.is_running():
+            self.sim_runner.stop()
+            self.sim_runner.wait(_CLOSE_TIMEOUT)
+        super().closeEvent(event)
+
     def _show_about(self) -> None:
-        QtWidgets.QMessageBox.about(
-            self,
-            "About FLL-Sim",
-            (
-                "<h3>FLL-Sim - First Lego League Simulator</h3>\n"
-                "<p>Simulation environment for practicing FLL missions with a "
-                "virtual robot.</p>\n"
-                "<p>Launches the simulator module and provides basic tabs for "
-                "getting started.</p>\n"
-            ),
-        )
+        QtWidgets.QMessageBox.about(self, "About FLL-Sim", _ABOUT_HTML)
 
     def _update_status(self, msg: str) -> None:
         self.status_label.setText(msg)
@@ -249,8 +338,7 @@ def main() -> None:
     app.setApplicationVersion("0.8.0")
     app.setOrganizationName("FLL-Sim Project")
 
-    # App icon fallback
-    icon = QtGui.QIcon.fromTheme("applications-education")
+    icon = _app_icon()
     if not icon.isNull():
         app.setWindowIcon(icon)
 
@@ -11,28 +11,41 @@ import sys
 import os
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLabel, QPushButton, QComboBox, QTextEdit, QSpinBox,
+    QTabWidget, QLabel, QPushButton, QComboBox, QTextBrowser, QSpinBox,
     QCheckBox, QGroupBox, QGridLayout, QFormLayout, QProgressBar,
     QTreeWidget, QTreeWidgetItem, QListWidget, QSplitter, QFrame,
-    QMessageBox, QFileDialog, QStatusBar, QMenuBar, QToolBar,
-    QListWidgetItem
+    QMessageBox, QFileDialog, QStatusBar, QMenuBar, QToolBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QProcess, QProcessEnvironment, QThread, pyqtSignal,
+    QUrl
+)
+from PyQt6.QtGui import (
+    QIcon, QFont, QPixmap, QAction, QKeySequence, QDesktopServices
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QFont, QPixmap, QAction
 import threading
-import subprocess
 from pathlib import Path
 from typing import Optional, Dict, Any
+import csv
 import json
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional dependency
+    psutil = None
 
-# Add project src to path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
+# Add project src to path unless fll_sim is already importable
+project_root = Path(__file__).resolve().parents[3]
+try:
+    import fll_sim  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(project_root / "src"))
 
 from fll_sim.config.config_manager import ConfigManager
-from fll_sim.core.simulator import SimulationConfig
-from fll_sim.robot.robot import RobotConfig
 from fll_sim.cloud.sync import CloudSyncManager
+from fll_sim.cloud.scheduler import CloudSyncScheduler
+from fll_sim.cloud.status_reporter import CloudSyncStatusReporter
 
 # Import new modules for Phase 4.6-4.8 features
 from fll_sim.education.plugin_system import PluginManager
@@ -40,48 +53,218 @@ from fll_sim.education.i18n import I18nManager
 from fll_sim.education.accessibility import AccessibilityHelper
 
 
-class SimulationThread(QThread):
-    """Thread for running simulation in background."""
+# Simulation launch settings, computed once
+_PROJECT_DIR = str(project_root)
+_MAIN_SCRIPT = str(project_root / "main.py")
+_SIM_ENV = QProcessEnvironment.systemEnvironment()
+_SIM_ENV.insert("PYTHONUNBUFFERED", "1")
+_SIM_ENV.insert("FLL_SIM_STATUS_INTERVAL", "0.5")
+_SIM_ENV.insert("FLL_SIM_COMMANDS", "stdin")
+_SIM_ENV.insert("PYTHONPATH", os.pathsep.join(
+    filter(None, [str(project_root / "src"), _SIM_ENV.value("PYTHONPATH")])))
+
+# Help menu targets
+_DOCS_PATH = project_root / "docs" / "project_plan.md"
+_EXAMPLES_DIR = project_root / "examples"
+_ABOUT_HTML = (
+    "<h3>FLL-Sim v0.1.0</h3>"
+    "<p>A comprehensive simulation environment for First Lego League "
+    "competitions.</p>"
+    "<p>Develop, test and refine robot strategies in a realistic virtual "
+    "environment before physical implementation.</p>"
+    "<ul><li>Physics-based robot simulation</li>"
+    "<li>Pybricks-compatible API</li>"
+    "<li>Mission scoring system</li>"
+    "<li>Performance analytics</li>"
+    "<li>Educational tools</li></ul>"
+)
+
+# Window stylesheet, parsed by Qt once per window
+_LIGHT_QSS = """
+QMainWindow {
+    background-color: #f5f5f5;
+}
+QTabWidget::pane {
+    border: 1px solid #c0c0c0;
+    background-color: white;
+}
+QTabBar::tab {
+    background-color: #e0e0e0;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background-color: white;
+    border-bottom: 2px solid #2E86AB;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #cccccc;
+    border-radius: 5px;
+    margin-top: 1ex;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #2E86AB;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #1E5F7A;
+}
+QPushButton:pressed {
+    background-color: #0E3F5A;
+}
+QLabel[simState="running"] {
+    color: #2E7D32;
+    font-weight: bold;
+}
+
+QLabel[simState="paused"] {
+    color: #EF6C00;
+    font-weight: bold;
+}
+"""
+
+
+# Menu bar layout: (title, [(label, shortcut, slot name) or None]) where
+# None is a separator
+_MENUS = [
+    ('&File', [
+        ('&New Simulation', QKeySequence.StandardKey.New, '_new_simulation'),
+        ('&Load Configuration', QKeySequence.StandardKey.Open,
+         '_load_configuration'),
+        ('&Save Configuration', QKeySequence.StandardKey.Save,
+         '_save_configuration'),
+        None,
+        ('E&xit', QKeySequence.StandardKey.Quit, 'close'),
+    ]),
+    ('&Simulation', [
+        ('&Start Simulation', None, '_start_simulation'),
+        ('St&op Simulation', None, '_stop_simulation'),
+        None,
+        ('Run &Demo', None, '_run_demo'),
+        ('Run &Headless', None, '_run_headless'),
+    ]),
+    ('&Tools', [
+        ('&Mission Editor', None, '_open_mission_editor'),
+        ('&Robot Designer', None, '_open_robot_designer'),
+        ('&Performance Monitor', None, '_open_performance_monitor'),
+    ]),
+    ('&Help', [
+        ('&Documentation', None, '_open_documentation'),
+        ('&Examples', None, '_open_examples'),
+        ('&About', None, '_show_about'),
+    ]),
+]
+
+
+# Toolbar buttons: (text, slot name) or None for a separator
+_TOOLBAR = [
+    ("🚀 Start", '_start_simulation'),
+    ("⏹ Stop", '_stop_simulation'),
+    None,
+    ("🎮 Demo", '_run_demo'),
+    ("☁️ Sync Profile", 'sync_profile_to_cloud'),
+    ("▶️ Start Sync Scheduler", 'start_cloud_sync_scheduler'),
+    ("⏹ Stop Sync Scheduler", 'stop_cloud_sync_scheduler'),
+    ("📋 Sync Status", 'show_cloud_sync_status_history'),
+    None,
+]
+
+
+# Quick Start buttons: (text, slot name, tooltip)
+_QUICK_ACTIONS = (
+    ("🚀 Start Simulation", '_start_simulation',
+     "Launch the full simulation"),
+    ("🎮 Run Demo", '_run_demo',
+     "Try a quick demonstration"),
+    ("📚 View Examples", '_open_examples',
+     "Browse example programs"),
+    ("⚙️ Configure Robot", '_configure_robot',
+     "Set up your robot"),
+    ("🗺️ Load Mission", '_load_mission',
+     "Choose FLL missions"),
+    ("📊 Performance Monitor", '_open_performance_monitor',
+     "Track robot performance"),
+)
+
+
+_PROFILE_DESCRIPTIONS = {
+    'beginner': 'Simplified interface with basic features and guided assistance.',
+    'intermediate': 'Standard interface with full feature access and moderate complexity.',
+    'advanced': 'Complete access to all features including debugging and customization.'
+}
+
+_SEASON_DESCRIPTIONS = {
+    '2024': 'SUBMERGED: Ocean exploration and environmental protection missions.',
+    '2023': 'CARGO CONNECT: Transportation and logistics challenges.'
+}
+
+
+class MetricsWorker(QThread):
+    """Sample system CPU and this process's memory off the GUI thread."""
     
-    status_update = pyqtSignal(str)
-    finished = pyqtSignal()
+    metrics_ready = pyqtSignal(float, float)
     
-    def __init__(self, command):
-        super().__init__()
-        self.command = command
-        self.process = None
+    # Sampling period, slept in short slices so interruption stays prompt
+    INTERVAL_MS = 2000
+    SLICE_MS = 100
     
     def run(self):
-        """Run the simulation command."""
-        try:
-            self.status_update.emit("Starting simulation...")
-            self.process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=str(project_root)
-            )
-            
-            # Monitor process
-            while self.process.poll() is None:
-                self.msleep(100)
-            
-            if self.process.returncode == 0:
-                self.status_update.emit("Simulation completed successfully")
-            else:
-                self.status_update.emit("Simulation ended with errors")
-                
-        except Exception as e:
-            self.status_update.emit(f"Error running simulation: {e}")
-        finally:
-            self.finished.emit()
+        """Emit (CPU %, RSS in MB) every two seconds until interrupted."""
+        process = psutil.Process()
+        # Prime the counter; later non-blocking calls report since the last
+        psutil.cpu_percent(interval=None)
+        while not self._sleep_interval():
+            cpu = psutil.cpu_percent(interval=None)
+            self.metrics_ready.emit(cpu, process.memory_info().rss / 1e6)
     
-    def stop(self):
-        """Stop the simulation."""
-        if self.process and self.process.poll() is None:
-            self.process.terminate()
-            self.status_update.emit("Simulation stopped")
+    def _sleep_interval(self):
+        """Sleep one sampling period; return True if interrupted."""
+        for _ in range(self.INTERVAL_MS // self.SLICE_MS):
+            if self.isInterruptionRequested():
+                return True
+            self.msleep(self.SLICE_MS)
+        return self.isInterruptionRequested()
+
+
+def _plain_label(text=""):
+    """Return a QLabel that never runs the AutoText rich-text check."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    return label
+
+
+@contextmanager
+def _bulk_update(widget):
+    """Hold off repaints and signals on ``widget`` while it is refilled."""
+    widget.setUpdatesEnabled(False)
+    blocked = widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(blocked)
+        widget.setUpdatesEnabled(True)
+
+
+# Sample missions, in list order, with their descriptions
+_MISSION_DESCRIPTIONS = {
+    "Coral Nursery": "Transport coral pieces to designated nursery areas for restoration points.",
+    "Shark Habitat": "Carefully place sharks in their natural habitat zones using precision movements.",
+    "Ocean Cleanup": "Remove plastic debris and pollutants from the ocean environment.",
+    "Submersible Operation": "Navigate the submersible through underwater obstacles.",
+    "Whale Migration": "Guide whales along their migration route safely.",
+    "Kelp Forest": "Restore kelp forest ecosystems by replanting in designated areas."
+}
 
 
 class FLLSimGUI(QMainWindow):
@@ -107,7 +290,44 @@ class FLLSimGUI(QMainWindow):
         self.current_profile = "beginner"
         self.current_robot = "standard_fll"
         self.current_season = "2024"
-        self.simulation_thread = None
+        self._sim_status = "Stopped"
+        self._sim_time_text = "00:00:00"
+        self._fps_text = "0"
+        self._progress_value = 0
+        
+        # Widgets on lazily built tabs that handlers may touch earlier
+        self.profile_desc = None
+        self.season_desc = None
+        self.sim_status_label = None
+        self.sim_time_label = None
+        self.fps_label = None
+        self.fps_monitor_label = None
+        self.mission_progress = None
+        
+        # Status messages are coalesced to at most one repaint per 50 ms
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Escalates Stop to kill(); disarmed when the process ends so it
+        # can never hit a simulation started afterwards
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.setInterval(2000)
+        self._kill_timer.timeout.connect(self._kill_simulation)
+        
+        # Simulation child process, driven by Qt's event loop
+        self.sim_process = QProcess(self)
+        self.sim_process.setWorkingDirectory(_PROJECT_DIR)
+        self.sim_process.setProcessEnvironment(_SIM_ENV)
+        self.sim_process.readyReadStandardOutput.connect(
+            self._on_simulation_stdout)
+        self.sim_process.readyReadStandardError.connect(
+            self._on_simulation_stderr)
+        self.sim_process.errorOccurred.connect(self._on_simulation_error)
+        self.sim_process.finished.connect(self._on_simulation_finished)
         
         # Phase 4.6-4.8: Integration of new modules
         self.plugin_manager = PluginManager()
@@ -117,14 +337,12 @@ class FLLSimGUI(QMainWindow):
         # Cloud sync manager
         self.cloud_sync_manager = CloudSyncManager()
         # Cloud sync scheduler and status reporter
-        from fll_sim.cloud.scheduler import CloudSyncScheduler
-        from fll_sim.cloud.status_reporter import CloudSyncStatusReporter
         self.cloud_sync_scheduler = CloudSyncScheduler(self.cloud_sync_manager)
         self.cloud_sync_status_reporter = CloudSyncStatusReporter(self.cloud_sync_manager)
         
-        # Initialize GUI
-        self._setup_ui()
+        # Initialize GUI; style first so widgets are polished only once
         self._setup_styles()
+        self._setup_ui()
         self._load_initial_data()
     
     def _setup_ui(self):
@@ -155,188 +373,81 @@ class FLLSimGUI(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
         
-        # Create tabs
-        self._create_quick_start_tab()
-        self._create_configuration_tab()
-        self._create_simulation_tab()
-        self._create_missions_tab()
-        self._create_robot_tab()
-        self._create_monitor_tab()
+        # Create tabs; all but Quick Start are built on first visit.
+        # Add them as one batch with repaints and signals held off.
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        quick_start = QWidget()
+        self._create_quick_start_tab(quick_start)
+        # Tab indices by title, for navigation without magic numbers
+        self._tab_index = {
+            "Quick Start": self.tab_widget.addTab(quick_start, "Quick Start")}
+        self._lazy_tabs = {}
+        for title, builder in (
+                ("Configuration", self._create_configuration_tab),
+                ("Simulation", self._create_simulation_tab),
+                ("Missions", self._create_missions_tab),
+                ("Robot", self._create_robot_tab),
+                ("Monitor", self._create_monitor_tab)):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_index[title] = index
+            self._lazy_tabs[index] = builder
+        self.tab_widget.blockSignals(False)
+        self.tab_widget.setUpdatesEnabled(True)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+    
+    def _show_tab(self, title):
+        """Switch to the tab called ``title``."""
+        self.tab_widget.setCurrentIndex(self._tab_index[title])
+    
+    def _on_tab_changed(self, index):
+        """Build a lazily created tab the first time it is shown."""
+        build = self._lazy_tabs.pop(index, None)
+        if build is not None:
+            build(self.tab_widget.widget(index))
     
     def _setup_styles(self):
         """Set up application styles."""
-        # Set application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #c0c0c0;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid #2E86AB;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #2E86AB;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1E5F7A;
-            }
-            QPushButton:pressed {
-                background-color: #0E3F5A;
-            }
-        """)
+        self.setStyleSheet(_LIGHT_QSS)
     
     def _create_menu_bar(self):
         """Create the menu bar."""
         menubar = self.menuBar()
         
-        # File menu
-        file_menu = menubar.addMenu('&File')
-        
-        new_action = QAction('&New Simulation', self)
-        new_action.triggered.connect(self._new_simulation)
-        file_menu.addAction(new_action)
-        
-        load_action = QAction('&Load Configuration', self)
-        load_action.triggered.connect(self._load_configuration)
-        file_menu.addAction(load_action)
-        
-        save_action = QAction('&Save Configuration', self)
-        save_action.triggered.connect(self._save_configuration)
-        file_menu.addAction(save_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction('E&xit', self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Simulation menu
-        sim_menu = menubar.addMenu('&Simulation')
-        
-        start_action = QAction('&Start Simulation', self)
-        start_action.triggered.connect(self._start_simulation)
-        sim_menu.addAction(start_action)
-        
-        stop_action = QAction('St&op Simulation', self)
-        stop_action.triggered.connect(self._stop_simulation)
-        sim_menu.addAction(stop_action)
-        
-        sim_menu.addSeparator()
-        
-        demo_action = QAction('Run &Demo', self)
-        demo_action.triggered.connect(self._run_demo)
-        sim_menu.addAction(demo_action)
-        
-        headless_action = QAction('Run &Headless', self)
-        headless_action.triggered.connect(self._run_headless)
-        sim_menu.addAction(headless_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu('&Tools')
-        
-        mission_editor_action = QAction('&Mission Editor', self)
-        mission_editor_action.triggered.connect(self._open_mission_editor)
-        tools_menu.addAction(mission_editor_action)
-        
-        robot_designer_action = QAction('&Robot Designer', self)
-        robot_designer_action.triggered.connect(self._open_robot_designer)
-        tools_menu.addAction(robot_designer_action)
-        
-        monitor_action = QAction('&Performance Monitor', self)
-        monitor_action.triggered.connect(self._open_performance_monitor)
-        tools_menu.addAction(monitor_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu('&Help')
-        
-        docs_action = QAction('&Documentation', self)
-        docs_action.triggered.connect(self._open_documentation)
-        help_menu.addAction(docs_action)
-        
-        examples_action = QAction('&Examples', self)
-        examples_action.triggered.connect(self._open_examples)
-        help_menu.addAction(examples_action)
-        
-        about_action = QAction('&About', self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for title, items in _MENUS:
+            menu = menubar.addMenu(title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                label, shortcut, slot = item
+                action = QAction(label, self)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
     
     def _create_toolbar(self):
         """Create the toolbar."""
         toolbar = QToolBar()
         self.addToolBar(toolbar)
         
-        # Start simulation button
-        start_btn = QPushButton("🚀 Start")
-        start_btn.clicked.connect(self._start_simulation)
-        toolbar.addWidget(start_btn)
-        
-        # Stop simulation button
-        stop_btn = QPushButton("⏹ Stop")
-        stop_btn.clicked.connect(self._stop_simulation)
-        toolbar.addWidget(stop_btn)
-        
-        toolbar.addSeparator()
-        
-        # Demo button
-        demo_btn = QPushButton("🎮 Demo")
-        demo_btn.clicked.connect(self._run_demo)
-        toolbar.addWidget(demo_btn)
-        
-        # Cloud sync button
-        cloud_sync_btn = QPushButton("☁️ Sync Profile")
-        cloud_sync_btn.clicked.connect(self.sync_profile_to_cloud)
-        toolbar.addWidget(cloud_sync_btn)
-        
-        # Scheduler controls
-        start_scheduler_btn = QPushButton("▶️ Start Sync Scheduler")
-        start_scheduler_btn.clicked.connect(self.start_cloud_sync_scheduler)
-        toolbar.addWidget(start_scheduler_btn)
-        stop_scheduler_btn = QPushButton("⏹ Stop Sync Scheduler")
-        stop_scheduler_btn.clicked.connect(self.stop_cloud_sync_scheduler)
-        toolbar.addWidget(stop_scheduler_btn)
-        
-        # Status reporter button
-        status_report_btn = QPushButton("📋 Sync Status")
-        status_report_btn.clicked.connect(self.show_cloud_sync_status_history)
-        toolbar.addWidget(status_report_btn)
-        
-        toolbar.addSeparator()
+        for item in _TOOLBAR:
+            if item is None:
+                toolbar.addSeparator()
+                continue
+            text, slot = item
+            btn = QPushButton(text)
+            btn.clicked.connect(getattr(self, slot))
+            toolbar.addWidget(btn)
         
         # Progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         toolbar.addWidget(self.progress_bar)
     
-    def _create_quick_start_tab(self):
+    def _create_quick_start_tab(self, widget):
         """Create the quick start tab."""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Welcome section
@@ -367,24 +478,9 @@ class FLLSimGUI(QMainWindow):
         actions_layout = QGridLayout(actions_group)
         
         # Quick action buttons
-        buttons = [
-            ("🚀 Start Simulation", self._start_simulation,
-             "Launch the full simulation"),
-            ("🎮 Run Demo", self._run_demo,
-             "Try a quick demonstration"),
-            ("📚 View Examples", self._open_examples,
-             "Browse example programs"),
-            ("⚙️ Configure Robot", self._configure_robot,
-             "Set up your robot"),
-            ("🗺️ Load Mission", self._load_mission,
-             "Choose FLL missions"),
-            ("📊 Performance Monitor", self._open_performance_monitor,
-             "Track robot performance")
-        ]
-        
-        for i, (text, callback, tooltip) in enumerate(buttons):
+        for i, (text, slot, tooltip) in enumerate(_QUICK_ACTIONS):
             btn = QPushButton(text)
-            btn.clicked.connect(callback)
+            btn.clicked.connect(getattr(self, slot))
             btn.setToolTip(tooltip)
             btn.setMinimumHeight(50)
             actions_layout.addWidget(btn, i // 2, i % 2)
@@ -395,19 +491,16 @@ class FLLSimGUI(QMainWindow):
         status_group = QGroupBox("System Status")
         status_layout = QHBoxLayout(status_group)
         
-        self.status_label = QLabel("Ready")
+        self.status_label = _plain_label("Ready")
         status_layout.addWidget(self.status_label)
         
         status_layout.addStretch()
         
         layout.addWidget(status_group)
         layout.addStretch()
-        
-        self.tab_widget.addTab(widget, "Quick Start")
     
-    def _create_configuration_tab(self):
+    def _create_configuration_tab(self, widget):
         """Create the configuration tab."""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Profile selection
@@ -420,7 +513,8 @@ class FLLSimGUI(QMainWindow):
         self.profile_combo.currentTextChanged.connect(self._on_profile_changed)
         profile_layout.addRow("Profile:", self.profile_combo)
         
-        self.profile_desc = QLabel("")
+        self.profile_desc = _plain_label(
+            _PROFILE_DESCRIPTIONS.get(self.current_profile, ''))
         self.profile_desc.setWordWrap(True)
         profile_layout.addRow("Description:", self.profile_desc)
         
@@ -452,7 +546,8 @@ class FLLSimGUI(QMainWindow):
         self.season_combo.currentTextChanged.connect(self._on_season_changed)
         season_layout.addRow("Season:", self.season_combo)
         
-        self.season_desc = QLabel("")
+        self.season_desc = _plain_label(
+            _SEASON_DESCRIPTIONS.get(self.current_season, ''))
         self.season_desc.setWordWrap(True)
         season_layout.addRow("Description:", self.season_desc)
         
@@ -474,12 +569,9 @@ class FLLSimGUI(QMainWindow):
         
         layout.addWidget(advanced_group)
         layout.addStretch()
-        
-        self.tab_widget.addTab(widget, "Configuration")
     
-    def _create_simulation_tab(self):
+    def _create_simulation_tab(self, widget):
         """Create the simulation tab."""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Simulation control
@@ -510,13 +602,15 @@ class FLLSimGUI(QMainWindow):
         status_group = QGroupBox("Simulation Status")
         status_layout = QFormLayout(status_group)
         
-        self.sim_status_label = QLabel("Stopped")
+        self.sim_status_label = _plain_label(self._sim_status)
+        self.sim_status_label.setProperty(
+            "simState", self._sim_status.lower())
         status_layout.addRow("Status:", self.sim_status_label)
         
-        self.sim_time_label = QLabel("00:00:00")
+        self.sim_time_label = _plain_label(self._sim_time_text)
         status_layout.addRow("Time:", self.sim_time_label)
         
-        self.fps_label = QLabel("0")
+        self.fps_label = _plain_label(self._fps_text)
         status_layout.addRow("FPS:", self.fps_label)
         
         layout.addWidget(status_group)
@@ -526,19 +620,17 @@ class FLLSimGUI(QMainWindow):
         mission_layout = QVBoxLayout(mission_group)
         
         self.mission_progress = QProgressBar()
+        self.mission_progress.setValue(self._progress_value)
         mission_layout.addWidget(self.mission_progress)
         
-        self.score_label = QLabel("Score: 0")
+        self.score_label = _plain_label("Score: 0")
         mission_layout.addWidget(self.score_label)
         
         layout.addWidget(mission_group)
         layout.addStretch()
-        
-        self.tab_widget.addTab(widget, "Simulation")
     
-    def _create_missions_tab(self):
+    def _create_missions_tab(self, widget):
         """Create the missions tab."""
-        widget = QWidget()
         layout = QHBoxLayout(widget)
         
         # Mission list
@@ -567,28 +659,31 @@ class FLLSimGUI(QMainWindow):
         details_group = QGroupBox("Mission Details")
         details_layout = QVBoxLayout(details_group)
         
-        self.mission_name_label = QLabel("Select a mission")
+        self.mission_name_label = _plain_label("Select a mission")
         details_layout.addWidget(self.mission_name_label)
         
-        self.mission_description = QTextEdit()
+        self.mission_description = QTextBrowser()
+        self.mission_description.setOpenExternalLinks(True)
+        details_layout.addWidget(self.mission_description)
+        
         scoring_group = QGroupBox("Scoring")
         scoring_layout = QFormLayout(scoring_group)
         
-        self.max_score_label = QLabel("0")
+        self.max_score_label = _plain_label("0")
         scoring_layout.addRow("Max Score:", self.max_score_label)
         
-        self.time_limit_label = QLabel("N/A")
+        self.time_limit_label = _plain_label("N/A")
         scoring_layout.addRow("Time Limit:", self.time_limit_label)
         
         details_layout.addWidget(scoring_group)
         
         layout.addWidget(details_group)
         
-        self.tab_widget.addTab(widget, "Missions")
+        # Load available missions
+        self._load_missions()
     
-    def _create_robot_tab(self):
+    def _create_robot_tab(self, widget):
         """Create the robot tab."""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # Robot configuration
@@ -657,25 +752,22 @@ class FLLSimGUI(QMainWindow):
         
         sensor_layout.addLayout(sensor_btn_layout)
         layout.addWidget(sensor_group)
-        
-        self.tab_widget.addTab(widget, "Robot")
     
-    def _create_monitor_tab(self):
+    def _create_monitor_tab(self, widget):
         """Create the performance monitor tab."""
-        widget = QWidget()
         layout = QVBoxLayout(widget)
         
         # System metrics
         system_group = QGroupBox("System Performance")
         system_layout = QFormLayout(system_group)
         
-        self.cpu_label = QLabel("0%")
+        self.cpu_label = _plain_label("0%")
         system_layout.addRow("CPU Usage:", self.cpu_label)
         
-        self.memory_label = QLabel("0 MB")
+        self.memory_label = _plain_label("0 MB")
         system_layout.addRow("Memory Usage:", self.memory_label)
         
-        self.fps_monitor_label = QLabel("0")
+        self.fps_monitor_label = _plain_label(self._fps_text)
         system_layout.addRow("FPS:", self.fps_monitor_label)
         
         layout.addWidget(system_group)
@@ -684,13 +776,13 @@ class FLLSimGUI(QMainWindow):
         mission_metrics_group = QGroupBox("Mission Performance")
         mission_metrics_layout = QFormLayout(mission_metrics_group)
         
-        self.success_rate_label = QLabel("0%")
+        self.success_rate_label = _plain_label("0%")
         mission_metrics_layout.addRow("Success Rate:", self.success_rate_label)
         
-        self.avg_score_label = QLabel("0")
+        self.avg_score_label = _plain_label("0")
         mission_metrics_layout.addRow("Average Score:", self.avg_score_label)
         
-        self.best_time_label = QLabel("N/A")
+        self.best_time_label = _plain_label("N/A")
         mission_metrics_layout.addRow("Best Time:", self.best_time_label)
         
         layout.addWidget(mission_metrics_group)
@@ -710,36 +802,87 @@ class FLLSimGUI(QMainWindow):
         
         layout.addStretch()
         
-        self.tab_widget.addTab(widget, "Monitor")
+        self._start_metrics_worker()
     
     def _load_initial_data(self):
         """Load initial application data."""
-        # Update profile description
-        self._on_profile_changed(self.current_profile)
-        
-        # Update season description
-        self._on_season_changed(self.current_season)
-        
-        # Load available missions
-        self._load_missions()
+        # System metrics are sampled only once the Monitor tab exists
+        self.metrics_worker = None
+    
+    def _start_metrics_worker(self):
+        """Start sampling system metrics for the Monitor tab."""
+        if psutil is None:
+            self.cpu_label.setText("N/A (install psutil)")
+            self.memory_label.setText("N/A")
+            return
+        self.metrics_worker = MetricsWorker(self)
+        self.metrics_worker.metrics_ready.connect(self._on_metrics_ready)
+        self.metrics_worker.start()
+    
+    def _on_metrics_ready(self, cpu, memory_mb):
+        """Show a metrics sample."""
+        self._set_label(self.cpu_label, f"{cpu:.0f}%")
+        self._set_label(self.memory_label, f"{memory_mb:.0f} MB")
+    
+    def _export_performance_data(self):
+        """Export the Monitor tab's metrics and history to CSV or JSON."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Performance Data", "",
+            "CSV files (*.csv);;JSON files (*.json);;All files (*)")
+        if not file_path:
+            return
+        
+        performance_data = {
+            'CPU Usage': self.cpu_label.text(),
+            'Memory Usage': self.memory_label.text(),
+            'FPS': self.fps_monitor_label.text(),
+            'Success Rate': self.success_rate_label.text(),
+            'Average Score': self.avg_score_label.text(),
+            'Best Time': self.best_time_label.text(),
+            'history': [self.history_list.item(i).text()
+                        for i in range(self.history_list.count())],
+        }
         
-        # Set up performance monitoring timer
-        self.perf_timer = QTimer()
-        self.perf_timer.timeout.connect(self._update_performance_metrics)
-        self.perf_timer.start(1000)  # Update every second
+        try:
+            if file_path.lower().endswith('.json'):
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(performance_data, f, indent=2,
+                              ensure_ascii=False)
+            else:
+                with open(file_path, 'w', newline='',
+                          encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerows(
+                        (k, v) for k, v in performance_data.items()
+                        if k != 'history')
+                    writer.writerow(['History', ''])
+                    writer.writerows(
+                        ('', entry) for entry in performance_data['history'])
+            self._update_status(f"Data exported to: {file_path}")
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", str(e))
+    
+    def closeEvent(self, event):
+        """Stop background work and child processes before closing."""
+        if self.metrics_worker is not None:
+            self.metrics_worker.requestInterruption()
+            self.metrics_worker.wait()
+        # Reap the simulator rather than leaving it running past the GUI
+        if self.sim_process.state() != QProcess.ProcessState.NotRunning:
+            self.sim_process.terminate()
+            if not self.sim_process.waitForFinished(1000):
+                self.sim_process.kill()
+                self.sim_process.waitForFinished(1000)
+        super().closeEvent(event)
     
     # Event handlers and utility methods
     def _on_profile_changed(self, profile):
         """Handle profile selection change."""
         self.current_profile = profile
         
-        descriptions = {
-            'beginner': 'Simplified interface with basic features and guided assistance.',
-            'intermediate': 'Standard interface with full feature access and moderate complexity.',
-            'advanced': 'Complete access to all features including debugging and customization.'
-        }
-        
-        self.profile_desc.setText(descriptions.get(profile, ''))
+        if self.profile_desc is not None:
+            self._set_label(
+                self.profile_desc, _PROFILE_DESCRIPTIONS.get(profile, ''))
         self._update_status(f"Profile changed to: {profile}")
     
     def _on_robot_changed(self, robot):
@@ -751,49 +894,375 @@ class FLLSimGUI(QMainWindow):
         """Handle season selection change."""
         self.current_season = season
         
-        descriptions = {
-            '2024': 'SUBMERGED: Ocean exploration and environmental protection missions.',
-            '2023': 'CARGO CONNECT: Transportation and logistics challenges.'
-        }
-        
-        self.season_desc.setText(descriptions.get(season, ''))
+        if self.season_desc is not None:
+            self._set_label(
+                self.season_desc, _SEASON_DESCRIPTIONS.get(season, ''))
         self._update_status(f"Season changed to: {season}")
     
-    def _load_missions(self):
-        """Load available missions into the list."""
-        self.missions_list.clear()
+    def _apply_configuration(self, profile, robot, season, message):
+        """Switch profile, robot and season with a single status update.
         
-        missions = [
-            "Coral Nursery",
-            "Shark Habitat", 
-            "Ocean Cleanup",
-            "Submersible Operation",
-            "Whale Migration",
-            "Kelp Forest"
-        ]
+        The combo signals are blocked while they are set, so the three
+        ``_on_*_changed`` handlers do not each rewrite the status bar.
+        """
+        self.current_profile = profile
+        self.current_robot = robot
+        self.current_season = season
         
-        for mission in missions:
-            item = QListWidgetItem(mission)
-            self.missions_list.addItem(item)
+        # The combos only exist once the Configuration tab has been built
+        if self.profile_desc is not None:
+            for combo, text in ((self.profile_combo, profile),
+                                (self.robot_combo, robot),
+                                (self.season_combo, season)):
+                with _bulk_update(combo):
+                    combo.setCurrentText(text)
+            self._set_label(
+                self.profile_desc, _PROFILE_DESCRIPTIONS.get(profile, ''))
+            self._set_label(
+                self.season_desc, _SEASON_DESCRIPTIONS.get(season, ''))
+        self._update_status(message)
+    
+    def _new_simulation(self):
+        """Reset the configuration to its defaults."""
+        self._apply_configuration(
+            "beginner", "standard_fll", "2024", "New simulation")
+    
+    def _load_configuration(self):
+        """Load profile, robot and season from a JSON file."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Load Configuration", "",
+            "JSON files (*.json);;All files (*)")
+        if not file_path:
+            return
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                data = json.load(f)
+            self._apply_configuration(
+                data.get('profile', self.current_profile),
+                data.get('robot', self.current_robot),
+                data.get('season', self.current_season),
+                f"Configuration loaded from {file_path}")
+        except (OSError, ValueError, AttributeError) as e:
+            QMessageBox.critical(
+                self, "Load Error", f"Failed to load configuration: {e}")
+    
+    def _save_configuration(self):
+        """Save profile, robot and season to a JSON file."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Configuration", "",
+            "JSON files (*.json);;All files (*)")
+        if not file_path:
+            return
+        data = {
+            'profile': self.current_profile,
+            'robot': self.current_robot,
+            'season': self.current_season,
+        }
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            self._update_status(f"Configuration saved to {file_path}")
+        except OSError as e:
+            QMessageBox.critical(
+                self, "Save Error", f"Failed to save configuration: {e}")
+    
+    def _configure_robot(self):
+        """Switch to the Robot tab."""
+        self._show_tab("Robot")
+    
+    def _load_mission(self):
+        """Switch to the Missions tab."""
+        self._show_tab("Missions")
+    
+    def _add_motor(self):
+        """Add a motor on the next free port."""
+        self._add_port_row(
+            self.motor_tree, "ABCDEF", ["Medium Motor", "1000 deg/s"])
+    
+    def _remove_motor(self):
+        """Remove the selected motor, or the last one."""
+        self._remove_port_row(self.motor_tree)
+    
+    def _add_sensor(self):
+        """Add a sensor on the next free port."""
+        self._add_port_row(
+            self.sensor_tree, "1234", ["Color Sensor", "Front"])
+    
+    def _remove_sensor(self):
+        """Remove the selected sensor, or the last one."""
+        self._remove_port_row(self.sensor_tree)
+    
+    def _add_port_row(self, tree, ports, columns):
+        """Append a row on the first port of ``ports`` not yet used."""
+        used = {tree.topLevelItem(i).text(0)
+                for i in range(tree.topLevelItemCount())}
+        free = [port for port in ports if port not in used]
+        if not free:
+            self._update_status("All ports are in use")
+            return
+        tree.addTopLevelItem(QTreeWidgetItem([free[0], *columns]))
+    
+    @staticmethod
+    def _remove_port_row(tree):
+        """Remove the current row, falling back to the last one."""
+        item = tree.currentItem()
+        if item is None and tree.topLevelItemCount():
+            item = tree.topLevelItem(tree.topLevelItemCount() - 1)
+        if item is not None:
+            tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+    
+    def _load_missions(self):
+        """Load available missions into the list."""
+        with _bulk_update(self.missions_list):
+            self.missions_list.clear()
+            self.missions_list.addItems(list(_MISSION_DESCRIPTIONS))
     
     def _on_mission_selected(self, item):
         """Handle mission selection."""
         mission_name = item.text()
-        self.mission_name_label.setText(f"Mission: {mission_name}")
-        
-        # Sample mission descriptions
-        descriptions = {
-            "Coral Nursery": "Transport coral pieces to designated nursery areas for restoration points.",
-            "Shark Habitat": "Carefully place sharks in their natural habitat zones using precision movements.",
-            "Ocean Cleanup": "Remove plastic debris and pollutants from the ocean environment.",
-            "Submersible Operation": "Navigate the submersible through underwater obstacles.",
-            "Whale Migration": "Guide whales along their migration route safely.",
-            "Kelp Forest": "Restore kelp forest ecosystems by replanting in designated areas."
-        }
+        self._set_label(self.mission_name_label, f"Mission: {mission_name}")
         
-        self.mission_description.setText(descriptions.get(mission_name, "Mission description not available."))
-        self.max_score_label.setText("100")
-        self.time_limit_label.setText("2:30")
+        self.mission_description.setPlainText(_MISSION_DESCRIPTIONS.get(
+            mission_name, "Mission description not available."))
+        self._set_label(self.max_score_label, "100")
+        self._set_label(self.time_limit_label, "2:30")
+    
+    # Tools
+    def _open_mission_editor(self):
+        """Open the mission editor dialog."""
+        try:
+            from fll_sim.gui.mission_editor_pyqt import MissionEditorDialog
+        except ImportError:
+            self._update_status("Mission editor module not available")
+            return
+        dialog = MissionEditorDialog(self)
+        if dialog.exec() and dialog.get_result():
+            self._update_status("Mission saved")
+    
+    def _open_robot_designer(self):
+        """Open the robot designer dialog."""
+        try:
+            from fll_sim.gui.robot_designer_pyqt import RobotDesignerDialog
+        except ImportError:
+            self._update_status("Robot designer module not available")
+            return
+        dialog = RobotDesignerDialog(self)
+        if dialog.exec() and dialog.get_result():
+            self._update_status("Robot configuration updated")
+    
+    def _open_performance_monitor(self):
+        """Switch to the Monitor tab."""
+        self._show_tab("Monitor")
+    
+    # Help
+    def _open_documentation(self):
+        """Open the project documentation in the desktop viewer."""
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(_DOCS_PATH))):
+            self._update_status("Could not open documentation")
+    
+    def _open_examples(self):
+        """Open the examples directory in the desktop file manager."""
+        if not _EXAMPLES_DIR.is_dir():
+            self._update_status("Examples directory not found")
+            return
+        # Qt hands the URL to the platform opener; no per-OS branching
+        if not QDesktopServices.openUrl(
+                QUrl.fromLocalFile(str(_EXAMPLES_DIR))):
+            self._update_status("Could not open examples directory")
+    
+    def _show_about(self):
+        """Show the About dialog."""
+        QMessageBox.about(self, "About FLL-Sim", _ABOUT_HTML)
+    
+    # Simulation process
+    def _start_simulation(self):
+        """Start the simulation."""
+        self._launch_simulation(["--season", self.current_season])
+    
+    def _run_demo(self):
+        """Run a demonstration."""
+        self._launch_simulation(["--demo", "basic"])
+    
+    def _run_headless(self):
+        """Run simulation in headless mode."""
+        self._launch_simulation(
+            ["--headless", "--season", self.current_season])
+    
+    def _launch_simulation(self, args):
+        """Start ``main.py`` with ``args`` in the simulation process."""
+        if self.sim_process.state() != QProcess.ProcessState.NotRunning:
+            QMessageBox.warning(
+                self, "Warning", "Simulation is already running!")
+            return
+        
+        self._kill_timer.stop()
+        self._update_status("Starting simulation...")
+        self._set_sim_status("Running")
+        self._progress_value = 0
+        if self.mission_progress is not None:
+            self.mission_progress.setValue(0)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.sim_process.start(sys.executable, [_MAIN_SCRIPT, *args])
+    
+    def _stop_simulation(self):
+        """Stop the simulation, killing it if it ignores the request."""
+        if self.sim_process.state() == QProcess.ProcessState.NotRunning:
+            return
+        self.sim_process.terminate()
+        self._kill_timer.start()
+        self._update_status("Simulation stopped")
+    
+    def _pause_simulation(self):
+        """Toggle pause in the running simulation."""
+        if not self._send_simulation_command(b"pause\n"):
+            return
+        paused = self._sim_status != "Paused"
+        self._set_sim_status("Paused" if paused else "Running")
+        self._update_status(
+            "Simulation paused" if paused else "Simulation resumed")
+    
+    def _reset_simulation(self):
+        """Reset the running simulation to its initial state."""
+        if self._send_simulation_command(b"reset\n"):
+            self._update_status("Simulation reset")
+    
+    def _send_simulation_command(self, command):
+        """Write a command line to the simulator; False if none is running."""
+        if self.sim_process.state() != QProcess.ProcessState.Running:
+            self._update_status("No simulation is running")
+            return False
+        self.sim_process.write(command)
+        return True
+    
+    def _kill_simulation(self):
+        """Kill the simulation if it survived ``terminate()``."""
+        if self.sim_process.state() != QProcess.ProcessState.NotRunning:
+            self.sim_process.kill()
+    
+    def _on_simulation_stdout(self):
+        """Forward complete stdout lines to the status bar."""
+        self._forward_simulation_output(
+            QProcess.ProcessChannel.StandardOutput)
+    
+    def _on_simulation_stderr(self):
+        """Forward complete stderr lines to the status bar."""
+        self._forward_simulation_output(
+            QProcess.ProcessChannel.StandardError)
+    
+    def _forward_simulation_output(self, channel, final=False):
+        """Show each complete line waiting on ``channel``.
+        
+        With ``final`` set, an unterminated last line is shown too.
+        """
+        self.sim_process.setReadChannel(channel)
+        while self.sim_process.canReadLine():
+            self._show_simulation_line(bytes(self.sim_process.readLine()))
+        if final:
+            self._show_simulation_line(bytes(self.sim_process.readAll()))
+    
+    def _show_simulation_line(self, data):
+        """Route one line of simulation output.
+        
+        JSON object lines are status reports from the simulator and update
+        the time and FPS labels; anything else goes to the status bar.
+        """
+        line = data.decode(errors="replace").strip()
+        if line.startswith("{"):
+            try:
+                self._apply_simulation_report(json.loads(line))
+                return
+            except (ValueError, TypeError, KeyError):
+                pass
+        if line:
+            self._update_status(line)
+    
+    def _apply_simulation_report(self, report):
+        """Update the simulation labels and progress from a status report."""
+        seconds = int(report["time"])
+        self._sim_time_text = (
+            f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}")
+        self._fps_text = f"{report['fps']:.0f}"
+        if self.sim_time_label is not None:
+            self._set_label(self.sim_time_label, self._sim_time_text)
+        for label in (self.fps_label, self.fps_monitor_label):
+            if label is not None:
+                self._set_label(label, self._fps_text)
+        
+        # Match progress is only reported in competition mode; until then
+        # the toolbar bar stays a busy indicator
+        if "progress" in report:
+            self._progress_value = int(report["progress"] * 100)
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(self._progress_value)
+            if self.mission_progress is not None:
+                self.mission_progress.setValue(self._progress_value)
+    
+    def _on_simulation_error(self, error):
+        """Report a process that failed to start or crashed."""
+        if error == QProcess.ProcessError.FailedToStart:
+            self._update_status(
+                f"Error running simulation: {self.sim_process.errorString()}")
+            self._simulation_ended()
+    
+    def _on_simulation_finished(self, exit_code, exit_status):
+        """Report how the simulation process ended."""
+        for channel in (QProcess.ProcessChannel.StandardOutput,
+                        QProcess.ProcessChannel.StandardError):
+            self._forward_simulation_output(channel, final=True)
+        if (exit_status == QProcess.ExitStatus.NormalExit
+                and exit_code == 0):
+            self._update_status("Simulation completed successfully")
+        else:
+            self._update_status("Simulation ended with errors")
+        self._simulation_ended()
+    
+    def _simulation_ended(self):
+        """Restore the idle simulation state."""
+        self._kill_timer.stop()
+        self._set_sim_status("Stopped")
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setVisible(False)
+    
+    def _set_sim_status(self, status):
+        """Record the simulation state and show it if its tab exists."""
+        self._sim_status = status
+        label = self.sim_status_label
+        if label is not None and label.text() != status:
+            label.setText(status)
+            # Restyle just this label for the new [simState] selector
+            label.setProperty("simState", status.lower())
+            label.style().unpolish(label)
+            label.style().polish(label)
+    
+    def _update_status(self, message):
+        """Show ``message`` in the status bar and Quick Start tab.
+        
+        Only the latest message of a burst is shown, once the throttle
+        timer fires.
+        """
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """Apply the most recent status message."""
+        message, self._pending_status = self._pending_status, None
+        if message is None:
+            return
+        if self.status_bar.currentMessage() != message:
+            self.status_bar.showMessage(message)
+        self._set_label(self.status_label, message)
+    
+    @staticmethod
+    def _set_label(label, text):
+        """Set ``text`` on ``label`` only if it differs.
+        
+        An unchanged setText still invalidates the label's size hint and
+        schedules a repaint.
+        """
+        if label.text() != text:
+            label.setText(text)
     
     def sync_profile_to_cloud(self):
         """Sync the current user profile to the cloud."""
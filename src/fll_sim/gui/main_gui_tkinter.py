@@ -13,18 +13,26 @@ import subprocess
 import sys
 import threading
 import tkinter as tk
+import webbrowser
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 from typing import Any, Dict, Optional
 
-# Add project src to path
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root / "src"))
+# Add project src to path unless fll_sim is already importable
+project_root = Path(__file__).resolve().parents[3]
+try:
+    import fll_sim  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(project_root / "src"))
 
 from fll_sim.config.config_manager import ConfigManager
 from fll_sim.core.simulator import SimulationConfig
 from fll_sim.robot.robot import RobotConfig
 
+# Help menu targets, resolved once
+_DOCS_URL = (project_root / "docs" / "project_plan.md").as_uri()
+_EXAMPLES_URL = (project_root / "examples").as_uri()
+
 
 class FLLSimGUI:
     """
@@ -814,18 +822,14 @@ class FLLSimGUI:
     def _open_documentation(self):
         """Open documentation."""
         try:
-            import webbrowser
-            doc_path = project_root / "docs" / "project_plan.md"
-            webbrowser.open(str(doc_path))
+            webbrowser.open(_DOCS_URL)
         except:
             self._update_status("Could not open documentation")
     
     def _open_examples(self):
         """Open examples directory."""
         try:
-            import webbrowser
-            examples_path = project_root / "examples"
-            webbrowser.open(str(examples_path))
+            webbrowser.open(_EXAMPLES_URL)
         except:
             self._update_status("Could not open examples directory")
     
@@ -887,6 +891,11 @@ For more information, visit the documentation."""
         if self.simulation_process and self.simulation_process.poll() is None:
             if messagebox.askokcancel("Quit", "Simulation is running. Do you want to quit?"):
                 self.simulation_process.terminate()
+                try:
+                    self.simulation_process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    self.simulation_process.kill()
+                    self.simulation_process.wait()
                 self.root.destroy()
         else:
             self.root.destroy()
@@ -2,13 +2,29 @@
 
 Provides functions for listing, restoring, and managing backups.
 """
+import asyncio
 import os
 import shutil
-from typing import List
+import threading
+from typing import List, NamedTuple, Optional, Tuple
 
 from fll_sim.utils.errors import FLLSimError
 from fll_sim.utils.logger import FLLLogger
 
+# Maximum number of file copies in flight during a restore
+RESTORE_MAX_IN_FLIGHT = 64
+
+
+class BackupEntry(NamedTuple):
+    """Compact record describing one backup directory."""
+
+    name: str
+    mtime: float
+
+
+_singleton: Optional["BackupUtils"] = None
+_singleton_lock = threading.Lock()
+
 
 class BackupUtils:
     """Utility functions for backup history and restore management."""
@@ -17,6 +33,15 @@ class BackupUtils:
         self.logger = FLLLogger('BackupUtils')
         self.backup_dir = backup_dir
 
+    @classmethod
+    def instance(cls) -> "BackupUtils":
+        """Return the process-wide shared BackupUtils instance."""
+        global _singleton
+        with _singleton_lock:
+            if _singleton is None:
+                _singleton = cls()
+            return _singleton
+
     def list_backups(self) -> List[str]:
         """List all backup directories."""
         try:
@@ -30,6 +55,36 @@ class BackupUtils:
             self.logger.error(f"Error listing backups: {e}")
             raise FLLSimError(f"Error listing backups: {e}") from e
 
+    def list_backup_entries(self) -> List[BackupEntry]:
+        """List all backups with their modification time.
+
+        Only the backup directory itself is scanned; use backup_size()
+        for the size of a single backup.
+        """
+        try:
+            entries = []
+            with os.scandir(self.backup_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        entries.append(
+                            BackupEntry(entry.name, entry.stat().st_mtime)
+                        )
+            self.logger.info(f"Found {len(entries)} backups")
+            return entries
+        except Exception as e:
+            self.logger.error(f"Error listing backups: {e}")
+            raise FLLSimError(f"Error listing backups: {e}") from e
+
+    def backup_size(self, backup_name: str) -> int:
+        """Return the total size in bytes of the files in one backup."""
+        size = 0
+        for root, _dirs, files in os.walk(
+            os.path.join(self.backup_dir, backup_name)
+        ):
+            for name in files:
+                size += os.path.getsize(os.path.join(root, name))
+        return size
+
     def restore_backup(
         self,
         backup_name: str,
@@ -40,13 +95,12 @@ class BackupUtils:
         if not os.path.exists(backup_path):
             raise FLLSimError(f"Backup '{backup_name}' does not exist.")
         try:
-            for item in os.listdir(backup_path):
-                s = os.path.join(backup_path, item)
-                d = os.path.join(restore_path, item)
-                if os.path.isdir(s):
-                    shutil.copytree(s, d, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(s, d)
+            jobs, dirs = self._collect_restore_jobs(backup_path, restore_path)
+            asyncio.run(self._restore_async(jobs))
+            # Like copytree: directory metadata last, children first, so
+            # copying files does not bump the restored timestamps
+            for src, dst in reversed(dirs):
+                shutil.copystat(src, dst)
             self.logger.info(
                 f"Backup '{backup_name}' restored to {restore_path}."
             )
@@ -54,6 +108,48 @@ class BackupUtils:
             self.logger.error(f"Restore backup error: {e}")
             raise FLLSimError(f"Restore backup error: {e}") from e
 
+    @staticmethod
+    def _collect_restore_jobs(
+        backup_path: str, restore_path: str
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """Create the target tree and list file copy jobs.
+
+        Symlinks (to files or directories) are recreated as symlinks rather
+        than followed. Returns the (source, target) file copy jobs and the
+        restored subdirectories, in walk order, for copying their metadata.
+        """
+        jobs: List[Tuple[str, str]] = []
+        dirs: List[Tuple[str, str]] = []
+        for root, subdirs, files in os.walk(backup_path):
+            rel = os.path.relpath(root, backup_path)
+            target = os.path.normpath(os.path.join(restore_path, rel))
+            os.makedirs(target, exist_ok=True)
+            if rel != os.curdir:
+                dirs.append((root, target))
+            # os.walk lists symlinked directories but does not descend them
+            for name in subdirs + files:
+                src = os.path.join(root, name)
+                dst = os.path.join(target, name)
+                if os.path.islink(src):
+                    if os.path.islink(dst) or os.path.isfile(dst):
+                        os.remove(dst)
+                    os.symlink(os.readlink(src), dst)
+                elif name in files:
+                    jobs.append((src, dst))
+        return jobs, dirs
+
+    @staticmethod
+    async def _restore_async(jobs: List[Tuple[str, str]]) -> None:
+        """Copy files concurrently, bounded by RESTORE_MAX_IN_FLIGHT."""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(RESTORE_MAX_IN_FLIGHT)
+
+        async def _copy_one(src: str, dst: str) -> None:
+            async with semaphore:
+                await loop.run_in_executor(None, shutil.copy2, src, dst)
+
+        await asyncio.gather(*(_copy_one(s, d) for s, d in jobs))
+
     def delete_backup(self, backup_name: str) -> None:
         """Delete a backup directory."""
         try:
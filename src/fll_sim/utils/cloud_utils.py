@@ -9,11 +9,15 @@ from __future__ import annotations
 
 import os
 import shutil
-from typing import List
+import threading
+from typing import List, Optional
 
 from fll_sim.utils.errors import FLLSimError
 from fll_sim.utils.logger import FLLLogger
 
+_singleton: Optional["CloudUtils"] = None
+_singleton_lock = threading.Lock()
+
 
 class CloudUtils:
     """Utility functions for cloud sync and backup."""
@@ -21,6 +25,15 @@ class CloudUtils:
     def __init__(self) -> None:
         self.logger = FLLLogger("CloudUtils")
 
+    @classmethod
+    def instance(cls) -> "CloudUtils":
+        """Return the process-wide shared CloudUtils instance."""
+        global _singleton
+        with _singleton_lock:
+            if _singleton is None:
+                _singleton = cls()
+            return _singleton
+
     def backup_project(self, project_path: str, backup_dir: str) -> str:
         """Create or update a project backup directory.
 
@@ -0,0 +1,43 @@
+"""Numeric helpers for per-frame geometry queries.
+
+Compiled with Numba when it is installed; otherwise the same functions run
+as plain Python over NumPy arrays.
+"""
+from __future__ import annotations
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+def _jit(signature):
+    """Eagerly compile ``signature`` with Numba if available."""
+    if njit is None:
+        return lambda func: func
+    return njit(signature, cache=True)
+
+
+@_jit(
+    "int64(float64[:], float64[:], float64[:], float64[:], float64[:], "
+    "float64, float64)"
+)
+def zone_hit(xs, ys, ws, hs, angles, px, py):
+    """Index of the first centred, rotated rect containing (px, py), or -1.
+
+    Angles are in degrees, clockwise in y-down scene coordinates, matching
+    ``QGraphicsItem.setRotation``.
+    """
+    for i in range(xs.shape[0]):
+        dx = px - xs[i]
+        dy = py - ys[i]
+        if angles[i] != 0.0:
+            rad = math.radians(angles[i])
+            c = math.cos(rad)
+            s = math.sin(rad)
+            dx, dy = dx * c + dy * s, dy * c - dx * s
+        if abs(dx) <= ws[i] * 0.5 and abs(dy) <= hs[i] * 0.5:
+            return i
+    return -1
@@ -0,0 +1,83 @@
+"""
+Test Backup Utility Module
+
+Unit tests for BackupUtils listing and restore functions.
+"""
+import os
+import shutil
+import unittest
+
+from fll_sim.utils.backup_utils import BackupUtils
+from fll_sim.utils.errors import FLLSimError
+
+
+class TestBackupUtils(unittest.TestCase):
+    def setUp(self):
+        self.backup_dir = 'test_backup_utils_dir'
+        self.restore_dir = 'test_backup_utils_restore'
+        snapshot = os.path.join(self.backup_dir, 'snapshot', 'nested')
+        os.makedirs(snapshot, exist_ok=True)
+        with open(os.path.join(self.backup_dir, 'snapshot', 'a.txt'), 'w') as f:
+            f.write('a')
+        with open(os.path.join(snapshot, 'b.txt'), 'w') as f:
+            f.write('b')
+        os.makedirs(self.restore_dir, exist_ok=True)
+        self.utils = BackupUtils(backup_dir=self.backup_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.backup_dir, ignore_errors=True)
+        shutil.rmtree(self.restore_dir, ignore_errors=True)
+
+    def test_list_backups(self):
+        self.assertEqual(self.utils.list_backups(), ['snapshot'])
+
+    def test_list_backup_entries(self):
+        entries = self.utils.list_backup_entries()
+        self.assertEqual([e.name for e in entries], ['snapshot'])
+        self.assertEqual(
+            entries[0].mtime,
+            os.stat(os.path.join(self.backup_dir, 'snapshot')).st_mtime,
+        )
+
+    def test_backup_size(self):
+        self.assertEqual(self.utils.backup_size('snapshot'), 2)
+
+    def test_restore_backup_copies_tree(self):
+        self.utils.restore_backup('snapshot', restore_path=self.restore_dir)
+        with open(os.path.join(self.restore_dir, 'a.txt')) as f:
+            self.assertEqual(f.read(), 'a')
+        with open(os.path.join(self.restore_dir, 'nested', 'b.txt')) as f:
+            self.assertEqual(f.read(), 'b')
+
+    @unittest.skipUnless(hasattr(os, 'symlink') and os.name == 'posix',
+                         'symlinks need POSIX')
+    def test_restore_recreates_symlinks(self):
+        snapshot = os.path.join(self.backup_dir, 'snapshot')
+        os.symlink('a.txt', os.path.join(snapshot, 'link.txt'))
+        os.symlink('nested', os.path.join(snapshot, 'linkdir'))
+        self.utils.restore_backup('snapshot', restore_path=self.restore_dir)
+        for name, target in (('link.txt', 'a.txt'), ('linkdir', 'nested')):
+            path = os.path.join(self.restore_dir, name)
+            self.assertTrue(os.path.islink(path))
+            self.assertEqual(os.readlink(path), target)
+
+    def test_restore_copies_directory_metadata(self):
+        nested = os.path.join(self.backup_dir, 'snapshot', 'nested')
+        os.chmod(nested, 0o750)
+        os.utime(nested, (1_000_000_000, 1_000_000_000))
+        self.utils.restore_backup('snapshot', restore_path=self.restore_dir)
+        restored = os.stat(os.path.join(self.restore_dir, 'nested'))
+        self.assertEqual(restored.st_mtime, 1_000_000_000)
+        if os.name == 'posix':
+            self.assertEqual(restored.st_mode & 0o777, 0o750)
+
+    def test_restore_missing_backup(self):
+        with self.assertRaises(FLLSimError):
+            self.utils.restore_backup('missing', restore_path=self.restore_dir)
+
+    def test_instance_is_shared(self):
+        self.assertIs(BackupUtils.instance(), BackupUtils.instance())
+
+
+if __name__ == "__main__":
+    unittest.main()
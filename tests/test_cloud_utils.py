@@ -36,6 +36,9 @@ class TestCloudUtils(unittest.TestCase):
         backups = self.utils.list_backups(self.backup_dir)
         self.assertIn(os.path.basename(self.test_dir), backups)
 
+    def test_instance_is_shared(self):
+        self.assertIs(CloudUtils.instance(), CloudUtils.instance())
+
 if __name__ == "__main__":
     unittest.main()
 if __name__ == "__main__":
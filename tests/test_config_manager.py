@@ -0,0 +1,69 @@
+"""
+Test Config Manager Module
+
+Unit tests for ConfigManager's cached YAML reads and profile loading.
+"""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from fll_sim.config.config_manager import ConfigManager
+
+
+class TestConfigManagerYamlCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "robots.yaml"
+        self.path.write_text("alpha:\n  width: 1\n")
+        self.manager = ConfigManager()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_unchanged_file_is_parsed_once(self):
+        first = self.manager._read_yaml(self.path)
+        self.assertIs(self.manager._read_yaml(self.path), first)
+        self.assertEqual(first, {"alpha": {"width": 1}})
+
+    def test_modified_file_is_reparsed(self):
+        self.manager._read_yaml(self.path)
+        self.path.write_text("beta:\n  width: 2\n")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(
+            self.manager._read_yaml(self.path), {"beta": {"width": 2}}
+        )
+
+
+class TestConfigManagerLoadProfile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manager = ConfigManager()
+        self.manager.config_dir = Path(self._tmp.name)
+        self.manager._create_default_configs()
+        self.path = Path(self._tmp.name) / "team.yaml"
+        self.path.write_text(
+            "name: Team\n"
+            "description: Team profile\n"
+            "robot_config: standard_fll\n"
+            "simulation_config: debug\n"
+            "pybricks_config: precise\n"
+            "fll_season: '2024'\n"
+            "map_config:\n  width: 2400\n"
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_mutating_loaded_profile_leaves_cache_intact(self):
+        self.manager.load_profile(str(self.path))
+        self.manager.active_profile.map_config["width"] = 1
+        self.manager.load_profile(str(self.path))
+        self.assertEqual(
+            self.manager.active_profile.map_config, {"width": 2400}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Test Enhanced Simulator Module
+
+Import smoke tests for the PyQt6 enhanced simulator window and zone
+sampling on its map view.
+"""
+import importlib.util
+import os
+import unittest
+
+HAS_QT = importlib.util.find_spec("PyQt6") is not None
+
+
+@unittest.skipUnless(HAS_QT, "PyQt6 not installed")
+class TestEnhancedSimulatorImport(unittest.TestCase):
+    def test_module_imports(self):
+        from fll_sim.gui import enhanced_simulator as mod
+        self.assertTrue(callable(mod.FLLSimMainWindow._show_about))
+
+    def test_main_window_methods_are_not_shadowed(self):
+        from fll_sim.gui.enhanced_simulator import FLLSimMainWindow
+        for name in ("_build_ui", "_build_menu", "_run_code", "_show_about"):
+            self.assertIn(name, vars(FLLSimMainWindow))
+
+
+@unittest.skipUnless(HAS_QT, "PyQt6 not installed")
+class TestEnhancedSimulatorView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def _make_view(self):
+        from fll_sim.environment.game_map import ColorZone, GameMap
+        from fll_sim.gui.enhanced_simulator import EnhancedSimulatorView
+        game_map = GameMap()
+        game_map.color_zones.clear()  # drop the default zones
+        game_map.add_color_zone(
+            ColorZone("start", 300, 300, 200, 100, (255, 0, 0))
+        )
+        return game_map, EnhancedSimulatorView(game_map, use_opengl=False)
+
+    def test_sample_zone_at_before_show(self):
+        game_map, view = self._make_view()
+        zone = game_map.color_zones[0]
+        self.assertIs(view.sample_zone_at(350, 320), zone)
+        self.assertIsNone(view.sample_zone_at(50, 50))
+
+    def test_sample_zone_at_follows_refresh(self):
+        game_map, view = self._make_view()
+        zone = game_map.color_zones[0]
+        self.assertIs(view.sample_zone_at(300, 300), zone)
+        view.show()
+        while view._pending_elements is not None:
+            self.app.processEvents()
+        zone.x = 1000
+        view.refresh_map_objects()
+        self.assertIsNone(view.sample_zone_at(300, 300))
+        self.assertIs(view.sample_zone_at(1000, 300), zone)
+        view.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Test Fast Geometry Helpers
+
+Unit tests for the zone hit-test used by the simulator view.
+"""
+import unittest
+
+import numpy as np
+
+from fll_sim.visualization._fast import zone_hit
+
+
+def _columns(rects):
+    geom = np.asarray(rects, dtype=np.float64).reshape(-1, 5)
+    return tuple(np.ascontiguousarray(geom[:, k]) for k in range(5))
+
+
+class TestZoneHit(unittest.TestCase):
+    def test_axis_aligned(self):
+        cols = _columns([(0, 0, 100, 50, 0), (200, 0, 100, 50, 0)])
+        self.assertEqual(zone_hit(*cols, 10.0, 20.0), 0)
+        self.assertEqual(zone_hit(*cols, 240.0, -20.0), 1)
+        self.assertEqual(zone_hit(*cols, 100.0, 0.0), -1)
+
+    def test_rotated(self):
+        # A 100x10 bar turned 90 degrees now spans y rather than x
+        cols = _columns([(0, 0, 100, 10, 90)])
+        self.assertEqual(zone_hit(*cols, 0.0, 45.0), 0)
+        self.assertEqual(zone_hit(*cols, 45.0, 0.0), -1)
+
+    def test_first_match_wins(self):
+        cols = _columns([(0, 0, 100, 100, 0), (0, 0, 50, 50, 0)])
+        self.assertEqual(zone_hit(*cols, 0.0, 0.0), 0)
+
+    def test_empty(self):
+        self.assertEqual(zone_hit(*_columns([]), 0.0, 0.0), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
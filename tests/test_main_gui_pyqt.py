@@ -0,0 +1,64 @@
+"""
+Test PyQt Main GUI Module
+
+Offscreen construction smoke tests for the PyQt6 main window.
+"""
+import importlib.util
+import os
+import unittest
+
+HAS_QT = importlib.util.find_spec("PyQt6") is not None
+
+
+@unittest.skipUnless(HAS_QT, "PyQt6 not installed")
+class TestFLLSimGUI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from fll_sim.gui import main_gui_pyqt
+        self.mod = main_gui_pyqt
+        self.window = main_gui_pyqt.FLLSimGUI()
+
+    def tearDown(self):
+        self.window.close()
+
+    def test_every_action_slot_exists(self):
+        slots = [slot for _, items in self.mod._MENUS
+                 for item in items if item is not None
+                 for slot in item[2:]]
+        slots += [item[1] for item in self.mod._TOOLBAR if item is not None]
+        slots += [slot for _, slot, _ in self.mod._QUICK_ACTIONS]
+        for slot in slots:
+            self.assertTrue(callable(getattr(self.window, slot)), slot)
+
+    def test_all_tabs_build(self):
+        tabs = self.window.tab_widget
+        for index in range(tabs.count()):
+            tabs.setCurrentIndex(index)
+        self.assertEqual(self.window._lazy_tabs, {})
+        self.assertEqual(self.window.missions_list.count(),
+                         len(self.mod._MISSION_DESCRIPTIONS))
+
+    def test_motor_and_sensor_rows(self):
+        self.window._configure_robot()
+        for _ in range(7):
+            self.window._add_motor()
+        self.assertEqual(self.window.motor_tree.topLevelItemCount(), 6)
+        self.window._remove_motor()
+        self.assertEqual(self.window.motor_tree.topLevelItemCount(), 5)
+        self.window._add_sensor()
+        self.assertEqual(self.window.sensor_tree.topLevelItem(0).text(0), "1")
+        self.window._remove_sensor()
+        self.assertEqual(self.window.sensor_tree.topLevelItemCount(), 0)
+
+    def test_pause_without_simulation(self):
+        self.window._pause_simulation()
+        self.assertEqual(self.window._sim_status, "Stopped")
+
+
+if __name__ == '__main__':
+    unittest.main()